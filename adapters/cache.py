@@ -8,13 +8,23 @@ Use --force to bypass all caching.
 
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 
+# optional: C-level JSON encoder, falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_CACHE_PATH = "data/.fetch_cache.json"
 
+# resolved once per run rather than per should_fetch() call
+_CURRENT_YEAR = datetime.now().year
+
 
 def load_cache(root: Path) -> dict:
     """Load cache manifest. Returns dict with 'fetched' set."""
@@ -30,18 +40,35 @@ def load_cache(root: Path) -> dict:
 
 
 def save_cache(root: Path, cache: dict) -> None:
-    """Save cache manifest to disk."""
+    """Save cache manifest to disk.
+
+    Writes to a temporary file and renames it over the manifest, so an
+    interrupted run leaves the previous manifest intact.
+    """
     cache_path = root / DEFAULT_CACHE_PATH
     cache_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(cache_path, "w") as f:
-        json.dump(
-            {
-                "fetched": sorted(cache["fetched"]),
-                "updated": datetime.now().isoformat(),
-            },
-            f,
-            indent=2,
-        )
+    manifest = {
+        "fetched": sorted(cache["fetched"]),
+        "updated": datetime.now().isoformat(),
+    }
+    # the manifest is committed, so keep the sorted, indented layout for
+    # readable diffs; orjson produces identical output in one C-level dump
+    if orjson is not None:
+        buf = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(manifest, indent=2).encode("utf-8")
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(buf)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp_path.replace(cache_path)
+
+
+def refresh_current_year() -> None:
+    """Re-read the current year, e.g. at the start of a long-running fetch."""
+    global _CURRENT_YEAR
+    _CURRENT_YEAR = datetime.now().year
 
 
 def is_current_year(year: str) -> bool:
@@ -51,7 +78,7 @@ def is_current_year(year: str) -> bool:
     True, which would cause unnecessary re-fetches of cached data.
     """
     try:
-        return int(year) >= datetime.now().year
+        return int(year) >= _CURRENT_YEAR
     except (ValueError, TypeError):
         logger.warning(f"Non-integer year '{year}' passed to is_current_year, treating as historical")
         return False
@@ -66,9 +93,7 @@ def should_fetch(cache: dict, cache_key: str, year: str) -> bool:
     """
     if cache_key not in cache["fetched"]:
         return True
-    if is_current_year(year):
-        return True
-    return False
+    return is_current_year(year)
 
 
 def mark_fetched(cache: dict, cache_key: str) -> None:
@@ -11,16 +11,30 @@ API details:
   when a mailto: is included in the User-Agent header.
 - Rate limit: ~50 req/s in polite pool (with mailto)
 - Returns metadata including abstract (in JATS XML) and PDF links
+
+Lookups are cached by DOI in data/.crossref_cache.json (including
+not-found results), so re-runs only query new or expired DOIs.  DOI
+prefixes the cache shows Crossref consistently has nothing for are
+mostly skipped.
 """
 
+import json
 import logging
+import os
 import re
 import time
+from pathlib import Path
 from typing import Optional
 
 import requests
 
-from .http import fetch_with_retry as _fetch_with_retry
+# optional: C-level JSON decoder, falls back to resp.json()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .http import RateLimiter, fetch_parallel, fetch_with_retry as _fetch_with_retry, make_session
 
 logger = logging.getLogger(__name__)
 
@@ -31,16 +45,61 @@ _HEADERS = {
     "Accept": "application/json",
 }
 
-# polite request interval — Crossref polite pool is generous but we
-# stay conservative to avoid hitting limits during large runs.
+# starting request interval, and the fallback while Crossref sends no
+# X-Rate-Limit-* headers; _follow_rate_limit_headers retunes the limiter
 MIN_REQUEST_INTERVAL = 0.1  # 10 req/s baseline
 
+# once Crossref advertises its limit (X-Rate-Limit-Limit per
+# X-Rate-Limit-Interval) the limiter follows it, never faster than this
+FASTEST_REQUEST_INTERVAL = 0.01
+
+# a few requests in flight keep the rate limiter saturated despite
+# per-request latency, while staying polite on concurrency
+MAX_WORKERS = 4
+
+# one keep-alive session and one request budget for all DOI lookups in a run
+_SESSION = make_session(_HEADERS, pool_maxsize=MAX_WORKERS)
+_RATE_LIMITER = RateLimiter(1 / MIN_REQUEST_INTERVAL)
+
+# DOI -> lookup result cache; entries expire so abstracts that Crossref
+# backfills later are eventually picked up
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / ".crossref_cache.json"
+CACHE_TTL = 90 * 24 * 3600  # seconds
+
+# fetch_parallel default for lookups that raised, so they are not cached
+_FAILED = object()
+
+# DOI prefixes that Crossref (almost) never answers for, judged from the
+# cache, are skipped; every PREFIX_PROBE_EVERY-th DOI is still queried so
+# a prefix that starts resolving is noticed
+PREFIX_MIN_SAMPLES = 50
+PREFIX_MAX_MISS_RATE = 0.95
+PREFIX_PROBE_EVERY = 100
+
+
+# any tag, <jats:*> included, removed in a single pass
+_TAG_RE = re.compile(r"<[^>]+>")
+
 
 def _strip_jats(text: str) -> str:
     """Strip JATS XML tags from a Crossref abstract, returning plain text."""
-    text = re.sub(r"</?jats:[^>]+>", "", text)
-    text = re.sub(r"<[^>]+>", "", text)
-    return text.strip()
+    return _TAG_RE.sub("", text).strip()
+
+
+def _follow_rate_limit_headers(resp: requests.Response) -> None:
+    """Retune _RATE_LIMITER from Crossref's X-Rate-Limit-* headers."""
+    limit = resp.headers.get("X-Rate-Limit-Limit")
+    interval = resp.headers.get("X-Rate-Limit-Interval")
+    if not limit or not interval:
+        return
+    try:
+        seconds = float(interval.rstrip("s")) / float(limit)
+    except (ValueError, ZeroDivisionError):
+        return
+    seconds = max(FASTEST_REQUEST_INTERVAL, seconds)
+    if seconds != _RATE_LIMITER.interval:
+        logger.debug(f"Crossref advertises {limit} req per {interval}, spacing {seconds:.3f}s")
+        _RATE_LIMITER.set_rate(1 / seconds)
 
 
 def fetch_by_doi(doi: str) -> Optional[dict]:
@@ -48,20 +107,29 @@ def fetch_by_doi(doi: str) -> Optional[dict]:
 
     Returns:
         Dict with "abstract" and "pdf_url" keys (values may be None),
-        or None if the DOI was not found.
+        or None if the DOI was not found (404) or Crossref has neither.
+
+    Raises:
+        RuntimeError: When retries on 429/5xx run out.
+        ValueError: On a malformed JSON body.
+
+    Transient failures raise rather than return None, so fetch_batch
+    never caches them as not-found.
     """
     url = f"{CROSSREF_API}/{requests.utils.quote(doi, safe='')}"
-    resp = _fetch_with_retry(
-        url, headers=_HEADERS, max_retries=4, return_none_on_404=True,
-        rate_limit_codes=(429, 500, 502, 503, 504),
-    )
-    if resp is None:
-        return None
-
     try:
-        msg = resp.json().get("message", {})
-    except ValueError:
+        resp = _fetch_with_retry(
+            url, max_retries=4,
+            rate_limit_codes=(429, 500, 502, 503, 504), session=_SESSION,
+            rate_limiter=_RATE_LIMITER,
+        )
+    except FileNotFoundError:
         return None
+    _follow_rate_limit_headers(resp)
+
+    # orjson.JSONDecodeError subclasses ValueError, like resp.json()'s error
+    data = orjson.loads(resp.content) if orjson is not None else resp.json()
+    msg = data.get("message", {})
 
     # Abstract (may contain JATS XML tags)
     raw_abstract = msg.get("abstract", "")
@@ -88,27 +156,78 @@ def fetch_by_doi(doi: str) -> Optional[dict]:
     return None
 
 
+def load_doi_cache(cache_path: Path) -> dict[str, dict]:
+    """Load the DOI cache, dropping entries older than CACHE_TTL.
+
+    Each entry is {"abstract", "pdf_url", "fetched_at"} for a hit, or
+    {"not_found": True, "fetched_at"} for a DOI Crossref had nothing for.
+    """
+    if not cache_path.exists():
+        return {}
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            entries = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        logger.warning(f"Corrupt Crossref cache {cache_path}, starting fresh")
+        return {}
+    cutoff = time.time() - CACHE_TTL
+    return {
+        doi: entry for doi, entry in entries.items()
+        if entry.get("fetched_at", 0) >= cutoff
+    }
+
+
+def save_doi_cache(cache_path: Path, entries: dict[str, dict]) -> None:
+    """Atomically write the DOI cache (temp file + rename)."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entries, f, ensure_ascii=False, sort_keys=True)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp_path.replace(cache_path)
+
+
+def _dead_prefixes(cache: dict[str, dict]) -> set[str]:
+    """Return DOI prefixes whose cached lookups are overwhelmingly not-found."""
+    stats: dict[str, list[int]] = {}
+    for doi, entry in cache.items():
+        counts = stats.setdefault(doi.split("/", 1)[0], [0, 0])
+        counts[1 if entry.get("not_found") else 0] += 1
+    return {
+        prefix for prefix, (hits, misses) in stats.items()
+        if hits + misses >= PREFIX_MIN_SAMPLES
+        and misses / (hits + misses) > PREFIX_MAX_MISS_RATE
+    }
+
+
 def fetch_batch(
     papers: list[dict],
     *,
     needs_abstract: bool = True,
     needs_pdf: bool = True,
+    cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
 ) -> dict[str, dict]:
     """Fetch enrichment data for multiple papers by DOI.
 
     Only queries Crossref for papers that have a DOI and are missing
-    the requested fields (abstract and/or pdf_url).
+    the requested fields (abstract and/or pdf_url), and whose DOI is not
+    already in the on-disk cache.
 
     Args:
         papers: List of paper dicts with at least "doi" field.
         needs_abstract: Include papers missing abstracts.
         needs_pdf: Include papers missing pdf_url.
+        cache_path: DOI cache file, or None to always query Crossref.
 
     Returns:
         Dict mapping DOI -> {"abstract": str|None, "pdf_url": str|None}.
     """
-    # Select papers that need enrichment
+    # Select papers that need enrichment; a DOI shared by several papers
+    # is fetched once, since callers look results up by DOI
     to_fetch = []
+    seen: set[str] = set()
+    candidates = 0
     for p in papers:
         doi = p.get("doi", "").strip()
         if not doi:
@@ -116,48 +235,74 @@ def fetch_batch(
         missing_abs = needs_abstract and not p.get("abstract", "").strip()
         missing_pdf = needs_pdf and not p.get("pdf_url", "").strip()
         if missing_abs or missing_pdf:
-            to_fetch.append(doi)
+            candidates += 1
+            if doi not in seen:
+                seen.add(doi)
+                to_fetch.append(doi)
 
     if not to_fetch:
         logger.info("  No papers need Crossref enrichment")
         return {}
+    if len(to_fetch) < candidates:
+        logger.info(f"  {candidates} papers need enrichment, {len(to_fetch)} unique DOIs")
 
-    logger.info(f"  Fetching {len(to_fetch)} papers from Crossref...")
-
+    cache = load_doi_cache(cache_path) if cache_path is not None else {}
     results: dict[str, dict] = {}
-    found = 0
-    errors = 0
-    t_start = time.time()
-    last_request_time = 0.0
-
-    for i, doi in enumerate(to_fetch):
-        # Rate limiting
-        elapsed = time.time() - last_request_time
-        if elapsed < MIN_REQUEST_INTERVAL:
-            time.sleep(MIN_REQUEST_INTERVAL - elapsed)
+    misses = []
+    for doi in to_fetch:
+        entry = cache.get(doi)
+        if entry is None:
+            misses.append(doi)
+        elif not entry.get("not_found"):
+            results[doi] = {"abstract": entry.get("abstract"), "pdf_url": entry.get("pdf_url")}
+    if len(misses) < len(to_fetch):
+        logger.info(f"  {len(to_fetch) - len(misses)} DOIs answered from cache")
+
+    dead = _dead_prefixes(cache)
+    if dead:
+        kept = []
+        skipped = 0
+        for doi in misses:
+            if doi.split("/", 1)[0] in dead:
+                skipped += 1
+                if skipped % PREFIX_PROBE_EVERY:
+                    continue
+            kept.append(doi)
+        n_skipped = len(misses) - len(kept)
+        if n_skipped:
+            logger.info(
+                f"  Skipping {n_skipped} DOIs under prefixes Crossref "
+                f"does not resolve: {', '.join(sorted(dead))}"
+            )
+        misses = kept
+    if not misses:
+        return results
 
-        last_request_time = time.time()
-        result = fetch_by_doi(doi)
+    logger.info(f"  Fetching {len(misses)} papers from Crossref...")
 
-        if result is not None:
+    t_start = time.time()
+    # workers share _RATE_LIMITER, so total throughput stays at the polite rate
+    fetched = fetch_parallel(
+        misses, fetch_by_doi, max_workers=MAX_WORKERS, default=_FAILED, progress_interval=200,
+    )
+    now = int(time.time())
+    found = 0
+    errors = 0
+    for doi, result in fetched.items():
+        if result is _FAILED:
+            errors += 1
+        elif result is None:
+            cache[doi] = {"not_found": True, "fetched_at": now}
+        else:
             results[doi] = result
+            cache[doi] = {**result, "fetched_at": now}
             found += 1
-        else:
-            errors += 1
-
-        # Progress logging
-        if (i + 1) % 200 == 0 or i + 1 == len(to_fetch):
-            elapsed_total = time.time() - t_start
-            rate = (i + 1) / elapsed_total if elapsed_total > 0 else 0
-            logger.info(
-                f"  Crossref: {i + 1}/{len(to_fetch)} queried, "
-                f"{found} found, {errors} errors "
-                f"({rate:.1f} req/s)"
-            )
+    if cache_path is not None:
+        save_doi_cache(cache_path, cache)
 
     elapsed_total = time.time() - t_start
     logger.info(
-        f"  Crossref done: {found}/{len(to_fetch)} found "
+        f"  Crossref done: {found}/{len(misses)} found "
         f"in {elapsed_total:.0f}s ({errors} errors)"
     )
     return results
@@ -13,21 +13,33 @@ Two-phase approach:
 
 import re
 import logging
+import multiprocessing
+import queue
+import threading
 from html import unescape
 from pathlib import Path
 from typing import Optional
 
 from .common import (
-    make_bibtex_key, resolve_bibtex_collisions, normalize_paper, write_venue_json,
+    make_bibtex_key, resolve_bibtex_collisions, normalize_papers, write_venue_json,
+    load_known_abstracts,
     parse_author_name as _parse_author_name, strip_html as _strip_html,
 )
-from .http import fetch_with_retry as _fetch_with_retry, fetch_parallel
+from .http import fetch_with_retry as _fetch_with_retry, fetch_parallel, make_session
 from .cache import should_fetch, mark_fetched
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://openaccess.thecvf.com"
 
+# Concurrent paper-page fetches for abstracts; the shared session keeps
+# that many keep-alive connections open to openaccess.thecvf.com.
+ABSTRACT_WORKERS = 32
+_SESSION = make_session(pool_maxsize=ABSTRACT_WORKERS)
+
+# normalization pools start from the writer thread, so they must not fork
+_SPAWN = multiprocessing.get_context("spawn")
+
 # (conference, year) tuples
 # CVPR: annual since 2013
 # ICCV: biennial (odd years) since 2013
@@ -48,13 +60,30 @@ VENUE_NAMES = {
 }
 
 
+# listing page: one <dt class="ptitle"> block per paper
+_PTITLE_RE = re.compile(r'<dt\s+class="ptitle">')
+_TITLE_LINK_RE = re.compile(r'<a\s+href="([^"]*)"[^>]*>([^<]+)</a>')
+_DD_RE = re.compile(r'<dd>(.*?)</dd>', re.DOTALL)
+_AUTHOR_LINK_RE = re.compile(r'<a\s+[^>]*>([^<]+)</a>')
+# pdf / supp links after the authors, classified by label in one scan
+_LINK_RE = re.compile(r'<a\s+href="([^"]*)"[^>]*>([^<]*)</a>')
+# arXiv is matched on the href alone: its anchor text may hold nested markup
+_ARXIV_LINK_RE = re.compile(r'<a\s+href="(https?://arxiv\.org/[^"]*)"')
+_PAGES_RE = re.compile(r'pages\s*=\s*\{([^}]+)\}')
+
+# paper page: abstract div, or text after an "Abstract" heading as fallback
+_ABSTRACT_DIV_RE = re.compile(r'<div\s+id="abstract"[^>]*>(.*?)</div>', re.DOTALL)
+_ABSTRACT_FALLBACK_RE = re.compile(
+    r'(?:Abstract|ABSTRACT)\s*</?\w+[^>]*>\s*(.*?)(?:<div|<h[23]|<br\s*/?\s*><br)',
+    re.DOTALL,
+)
+
+
 def _make_absolute_url(path: str) -> str:
     """Ensure a URL path is absolute."""
     if path.startswith("http"):
         return path
-    if not path.startswith("/"):
-        path = f"/{path}"
-    return f"{BASE_URL}{path}"
+    return f"{BASE_URL}{path}" if path.startswith("/") else f"{BASE_URL}/{path}"
 
 
 def _list_papers(conference: str, year: str) -> list[dict]:
@@ -64,15 +93,19 @@ def _list_papers(conference: str, year: str) -> list[dict]:
     arxiv_url, bibtex, paper_html_path, pages.
     """
     url = f"{BASE_URL}/{conference}{year}?day=all"
-    resp = _fetch_with_retry(url)
+    resp = _fetch_with_retry(url, session=_SESSION)
     html = resp.text
 
     papers = []
 
-    blocks = re.split(r'<dt\s+class="ptitle">', html)
+    # each block runs from one ptitle marker to the next; the per-field
+    # regexes search within those bounds instead of on sliced copies
+    markers = list(_PTITLE_RE.finditer(html))
+    ends = [m.start() for m in markers[1:]] + [len(html)]
 
-    for block in blocks[1:]:
-        title_match = re.search(r'<a\s+href="([^"]*)"[^>]*>([^<]+)</a>', block)
+    for marker, end in zip(markers, ends):
+        start = marker.end()
+        title_match = _TITLE_LINK_RE.search(html, start, end)
         if not title_match:
             continue
         paper_html_path = title_match.group(1)
@@ -80,39 +113,37 @@ def _list_papers(conference: str, year: str) -> list[dict]:
             paper_html_path = f"/{paper_html_path}"
         title = unescape(title_match.group(2).strip())
 
-        dd_match = re.search(r'<dd>(.*?)</dd>', block, re.DOTALL)
+        dd_match = _DD_RE.search(html, start, end)
         if not dd_match:
             continue
         authors_block = dd_match.group(1)
         author_names = [
-            name.strip() for name in
-            re.findall(r'<a\s+[^>]*>([^<]+)</a>', authors_block)
-            if name.strip() and not name.strip().startswith('[')
+            name for name in map(str.strip, _AUTHOR_LINK_RE.findall(authors_block))
+            if name and not name.startswith('[')
         ]
         if not author_names:
             continue
 
-        authors = [_parse_author_name(name) for name in author_names]
+        authors = list(map(_parse_author_name, author_names))
 
-        remaining = block[dd_match.end():]
+        tail = dd_match.end()
 
         pdf_url = ""
-        pdf_match = re.search(r'<a\s+href="([^"]*\.pdf)"[^>]*>\s*pdf\s*</a>', remaining)
-        if pdf_match:
-            pdf_url = _make_absolute_url(pdf_match.group(1))
-
         supp_url = ""
-        supp_match = re.search(r'<a\s+href="([^"]*)"[^>]*>\s*supp\s*</a>', remaining)
-        if supp_match:
-            supp_url = _make_absolute_url(supp_match.group(1))
+        for href, label in _LINK_RE.findall(html, tail, end):
+            label = label.strip()
+            if label == "pdf" and not pdf_url and href.endswith(".pdf"):
+                pdf_url = _make_absolute_url(href)
+            elif label == "supp" and not supp_url:
+                supp_url = _make_absolute_url(href)
 
         arxiv_url = ""
-        arxiv_match = re.search(r'<a\s+href="(https?://arxiv\.org/[^"]*)"', remaining)
+        arxiv_match = _ARXIV_LINK_RE.search(html, tail, end)
         if arxiv_match:
             arxiv_url = arxiv_match.group(1)
 
         pages = ""
-        pages_match = re.search(r'pages\s*=\s*\{([^}]+)\}', remaining)
+        pages_match = _PAGES_RE.search(html, tail, end)
         if pages_match:
             pages = pages_match.group(1).strip()
 
@@ -133,22 +164,16 @@ def _fetch_abstract(paper_html_path: str) -> str:
     """Fetch abstract from an individual paper's HTML page."""
     url = _make_absolute_url(paper_html_path)
     try:
-        resp = _fetch_with_retry(url)
+        resp = _fetch_with_retry(url, session=_SESSION)
     except (FileNotFoundError, RuntimeError):
         return ""
 
-    match = re.search(
-        r'<div\s+id="abstract"[^>]*>(.*?)</div>',
-        resp.text, re.DOTALL,
-    )
+    match = _ABSTRACT_DIV_RE.search(resp.text)
     if match:
         return _strip_html(match.group(1))
 
     # fallback: text after "Abstract" heading
-    match = re.search(
-        r'(?:Abstract|ABSTRACT)\s*</?\w+[^>]*>\s*(.*?)(?:<div|<h[23]|<br\s*/?\s*><br)',
-        resp.text, re.DOTALL,
-    )
+    match = _ABSTRACT_FALLBACK_RE.search(resp.text)
     if match:
         return _strip_html(match.group(1))
 
@@ -157,7 +182,7 @@ def _fetch_abstract(paper_html_path: str) -> str:
 
 def _fetch_abstracts_parallel(
     paper_html_paths: list[str],
-    max_workers: int = 10,
+    max_workers: int = ABSTRACT_WORKERS,
 ) -> dict[str, str]:
     """Fetch abstracts for multiple papers in parallel."""
     return fetch_parallel(paper_html_paths, _fetch_abstract, max_workers=max_workers)
@@ -167,6 +192,7 @@ def process_conference_year(
     conference: str,
     year: str,
     fetch_abstracts: bool = True,
+    known_abstracts: Optional[dict[str, str]] = None,
 ) -> list[dict]:
     """Process a single conference-year from CVF Open Access.
 
@@ -174,6 +200,8 @@ def process_conference_year(
         conference: Conference name (CVPR, ICCV, WACV).
         year: Year string.
         fetch_abstracts: If True, fetch abstracts from individual pages.
+        known_abstracts: Abstracts from a previous run, keyed by paper
+            HTML path; those papers' pages are not fetched again.
     """
     venue_slug = conference.lower()
     venue_name = VENUE_NAMES.get(conference, f"Proceedings of {conference}")
@@ -189,9 +217,14 @@ def process_conference_year(
 
     abstracts: dict[str, str] = {}
     if fetch_abstracts:
-        paths = [e["paper_html_path"] for e in entries]
-        logger.info(f"  Fetching abstracts in parallel ({len(paths)} papers)...")
-        abstracts = _fetch_abstracts_parallel(paths)
+        known = known_abstracts or {}
+        paths = [e["paper_html_path"] for e in entries if e["paper_html_path"] not in known]
+        if known:
+            logger.info(f"  Reusing {len(entries) - len(paths)} abstracts from the previous run")
+        if paths:
+            logger.info(f"  Fetching abstracts in parallel ({len(paths)} papers)...")
+            abstracts = _fetch_abstracts_parallel(paths)
+        abstracts = {**known, **abstracts}
 
     papers = []
     bibtex_keys = []
@@ -242,6 +275,38 @@ def process_conference_year(
     return papers
 
 
+def _write_worker(
+    pending: queue.Queue,
+    output_dir: Path,
+    cache: Optional[dict],
+    errors: list[BaseException],
+) -> None:
+    """Normalize and write queued (venue_slug, year, papers) until None.
+
+    Runs on a background thread so the next conference's HTTP fetches
+    overlap with the previous one's normalization and disk write.  The
+    first failure is recorded in *errors*; later items are drained but
+    not written.
+    """
+    while True:
+        item = pending.get()
+        if item is None:
+            return
+        if errors:
+            continue
+        venue_slug, year, papers = item
+        try:
+            # spawn, not fork: forking here would copy a process whose HTTP
+            # worker threads may be holding locks
+            write_venue_json(
+                venue_slug, year, normalize_papers(papers, mp_context=_SPAWN), output_dir,
+            )
+            if cache is not None:
+                mark_fetched(cache, f"{venue_slug}-{year}")
+        except BaseException as e:
+            errors.append(e)
+
+
 def fetch_all(
     conferences: Optional[list[tuple[str, str]]] = None,
     output_dir: Optional[Path] = None,
@@ -265,25 +330,47 @@ def fetch_all(
 
     all_papers = {}
 
-    for conference, year in conferences:
-        venue_slug = conference.lower()
-        cache_key = f"{venue_slug}-{year}"
-
-        if cache is not None and not should_fetch(cache, cache_key, year):
-            logger.info(f"Skipping {conference} {year} — cached")
-            continue
-
-        papers = process_conference_year(
-            conference, year, fetch_abstracts=fetch_abstracts,
-        )
-
-        if papers:
-            venue_year = f"{venue_slug}-{year}"
-            all_papers[venue_year] = papers
-            write_venue_json(venue_slug, year, [normalize_paper(p) for p in papers], output_dir)
-            if cache is not None:
-                mark_fetched(cache, cache_key)
+    # a small bound keeps at most a couple of venues waiting in memory
+    pending: queue.Queue = queue.Queue(maxsize=2)
+    write_errors: list[BaseException] = []
+    writer = threading.Thread(
+        target=_write_worker, args=(pending, output_dir, cache, write_errors), daemon=True,
+    )
+    writer.start()
 
+    try:
+        for conference, year in conferences:
+            venue_slug = conference.lower()
+            cache_key = f"{venue_slug}-{year}"
+
+            if cache is not None and not should_fetch(cache, cache_key, year):
+                logger.info(f"Skipping {conference} {year} — cached")
+                continue
+            if write_errors:
+                break
+
+            # --force (no cache) re-fetches every abstract too
+            known_abstracts = None
+            if fetch_abstracts and cache is not None:
+                known_abstracts = load_known_abstracts(
+                    output_dir / f"{venue_slug}-{year}.json.gz", "source_id",
+                )
+
+            papers = process_conference_year(
+                conference, year, fetch_abstracts=fetch_abstracts,
+                known_abstracts=known_abstracts,
+            )
+
+            if papers:
+                venue_year = f"{venue_slug}-{year}"
+                all_papers[venue_year] = papers
+                pending.put((venue_slug, year, papers))
+    finally:
+        pending.put(None)
+        writer.join()
+
+    if write_errors:
+        raise write_errors[0]
     return all_papers
 
 
@@ -310,7 +397,7 @@ if __name__ == "__main__":
         output_dir = Path(args.output)
         output_dir.mkdir(parents=True, exist_ok=True)
         venue_slug = args.conference.lower()
-        out_path = write_venue_json(venue_slug, args.year, [normalize_paper(p) for p in papers], output_dir)
+        out_path = write_venue_json(venue_slug, args.year, normalize_papers(papers), output_dir)
         print(f"Wrote {len(papers)} papers to {out_path}")
     elif args.all:
         fetch_all(
@@ -15,13 +15,19 @@ Key quirks handled:
 - Author disambiguation suffixes: DBLP appends " 0001" etc. to names — stripped.
 - DBLP titles sometimes end with a period — stripped.
 
+Index pages and search results are cached on disk under .cache/dblp/
+(see CACHE_DIR), so re-runs within the TTL skip the rate-limited API.
+Delete that directory to force fresh data.
+
 Usage (standalone):
     python adapters/dblp.py --venue cvpr --max-year 2012
     python adapters/dblp.py --all --max-year 2015
 """
 
 import gzip
+import hashlib
 import json
+import os
 import re
 import time
 import logging
@@ -29,11 +35,19 @@ import threading
 from datetime import date
 import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from .common import make_bibtex_key, resolve_bibtex_collisions, normalize_paper, write_venue_json, parse_author_name
+# optional: C-level JSON decoder, falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .common import make_bibtex_key, resolve_bibtex_collisions_inplace, normalize_paper, write_venue_json, parse_author_name
 from .cache import should_fetch, mark_fetched
+from .http import RateLimiter, fetch_parallel, make_session
 
 logger = logging.getLogger(__name__)
 
@@ -44,10 +58,30 @@ _HEADERS = {
     "User-Agent": "mlanthology/1.0 (https://github.com/rbnyng/mlanthology; research use)"
 }
 
-# thread-safe rate limiter — DBLP enforces ~1 req/sec
-_rate_lock = threading.Lock()
-_last_request_time: float = 0.0
+# thread-safe rate limiter — DBLP enforces ~1 req/sec.  Workers reserve
+# slots and sleep outside the lock, so their requests still overlap.
 _MIN_REQUEST_INTERVAL = 1.5  # seconds between requests
+_RATE_LIMITER = RateLimiter(1 / _MIN_REQUEST_INTERVAL)
+
+# keep-alive connections to dblp.org shared by all workers; sized for the
+# default fetch_all concurrency, extra workers just open short-lived ones
+_SESSION = make_session(_HEADERS, pool_maxsize=8)
+
+# on-disk response cache: venue indexes and current-year proceedings can
+# still change, so they expire quickly; closed years are kept much longer
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "dblp"
+INDEX_CACHE_TTL = 6 * 3600  # seconds
+CLOSED_YEAR_CACHE_TTL = 30 * 24 * 3600
+
+# concurrent requests for result pages of one stem, or for fallback year
+# probes; the shared rate limiter still spaces them, but parsing and
+# latency overlap with waiting
+_PAGE_WORKERS = 4
+
+# proceedings stems: "cvpr2013", "eccv2024-7", or two-digit years ("uai95")
+_YEAR4_RE = re.compile(r'\d{4}')
+_LOWER_YEAR4_RE = re.compile(r'[a-z]+\d{4}')
+_LOWER_YY_RE = re.compile(r'[a-z]+(\d{2})(?:\D|$)')
 
 # venues and their DBLP config (start = earliest reliable year)
 DBLP_VENUES: dict[str, dict] = {
@@ -184,22 +218,15 @@ def _fetch_with_retry(url: str, max_retries: int = 4) -> Optional[requests.Respo
     """Fetch URL with exponential backoff, honoring DBLP rate limits.
 
     This is intentionally separate from http.fetch_with_retry() because DBLP
-    requires a thread-safe global rate limiter (_rate_lock / _last_request_time)
-    to stay under its 1 req/sec policy, and it honours the Retry-After header
-    on 429 responses — pushing the global timestamp forward so sibling threads
-    also back off.  Returns None on 404 or unrecoverable error.
+    honours the Retry-After header on 429 responses — pausing the global
+    _RATE_LIMITER for that long so sibling threads also back off.  Returns
+    None on 404 or unrecoverable error.
     """
-    global _last_request_time
     for attempt in range(max_retries):
         try:
-            with _rate_lock:
-                now = time.monotonic()
-                wait = _MIN_REQUEST_INTERVAL - (now - _last_request_time)
-                _last_request_time = max(now, _last_request_time + _MIN_REQUEST_INTERVAL)
-            if wait > 0:
-                time.sleep(wait)
+            _RATE_LIMITER.wait()
 
-            resp = requests.get(url, headers=_HEADERS, timeout=30)
+            resp = _SESSION.get(url, timeout=30)
             if resp.status_code == 200:
                 return resp
             if resp.status_code == 404:
@@ -209,11 +236,7 @@ def _fetch_with_retry(url: str, max_retries: int = 4) -> Optional[requests.Respo
                     retry_after = resp.headers.get("Retry-After")
                     wait = float(retry_after) if retry_after else 2 ** (attempt + 1)
                     # push global rate limiter forward so other threads back off too
-                    with _rate_lock:
-                        _last_request_time = max(
-                            _last_request_time,
-                            time.monotonic() + wait,
-                        )
+                    _RATE_LIMITER.pause(wait)
                 else:
                     wait = 2 ** (attempt + 1)
                 logger.warning(f"HTTP {resp.status_code} on {url}, retry in {wait}s")
@@ -228,103 +251,185 @@ def _fetch_with_retry(url: str, max_retries: int = 4) -> Optional[requests.Respo
     return None
 
 
-def _discover_venue_stems(dblp_key: str, start_year: int = 1965) -> dict[str, list[str]]:
+def _fetch_cached(url: str, ttl: float) -> Optional[bytes]:
+    """Return the body of *url*, from CACHE_DIR if fetched less than *ttl* ago.
+
+    Cache hits never touch the rate limiter.  Only 200 responses are
+    cached; returns None where _fetch_with_retry() would.
+    """
+    path = CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.gz"
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            with gzip.open(path, "rb") as f:
+                return f.read()
+    except (OSError, EOFError):
+        pass  # missing, unreadable, or truncated: refetch
+
+    resp = _fetch_with_retry(url)
+    if resp is None:
+        return None
+    body = resp.content
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # unique temp name: worker threads may fetch the same URL concurrently
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    with gzip.open(tmp_path, "wb", compresslevel=3) as f:
+        f.write(body)
+    tmp_path.replace(path)
+    return body
+
+
+@lru_cache(maxsize=None)
+def _index_link_re(dblp_key: str) -> re.Pattern:
+    """Compiled pattern for per-year page links on a DBLP venue index."""
+    return re.compile(rf'/db/{re.escape(dblp_key)}/([^/"]+)\.html')
+
+
+def _discover_venue_stems(
+    dblp_key: str,
+    start_year: int = 1965,
+    stem_filter: Optional[re.Pattern] = None,
+    current_year: Optional[int] = None,
+) -> dict[str, list[str]]:
     """Fetch the DBLP venue index page and return {year: [stem, ...]} mapping.
 
     Each stem is a filename without extension, e.g. "cvpr2013" or
     "eccv2024-7".  Multi-volume proceedings (ECCV) produce multiple stems
-    per year; they are all grouped under the same year key.
+    per year; they are all grouped under the same year key, sorted.
 
     Some venues (e.g. UAI) don't list year pages on their index — for those
     we fall back to probing individual year URLs directly.
 
     *start_year* controls the earliest year probed in the fallback path
-    (default 1965, covering IJCAI which began in 1969).
+    (default 1965, covering IJCAI which began in 1969).  When *stem_filter*
+    is given, only stems it matches (re.search) are kept; years left with
+    no stems are omitted.  *current_year* bounds the fallback probes
+    (default: today's year).
     """
     url = f"{DBLP_DB}/{dblp_key}/"
-    resp = _fetch_with_retry(url)
-    if resp is None:
+    body = _fetch_cached(url, INDEX_CACHE_TTL)
+    if body is None:
         logger.error(f"Could not fetch DBLP index for {dblp_key}: {url}")
         return {}
+    html = body.decode("utf-8", errors="replace")
 
-    # dict.fromkeys deduplicates while  preserving order
-    stems = list(dict.fromkeys(re.findall(
-        rf'/db/{re.escape(dblp_key)}/([^/"]+)\.html',
-        resp.text,
-    )))
+    # dict.fromkeys deduplicates while preserving order
+    stems = dict.fromkeys(m.group(1) for m in _index_link_re(dblp_key).finditer(html))
 
     by_year: dict[str, list[str]] = {}
+    has_year_links = False
     for stem in stems:
-        year_match = re.search(r'(\d{4})', stem)
-        if year_match:
-            if not re.match(r'^[a-z]+\d{4}', stem):
-                continue
-            year = year_match.group(1)
+        m = _LOWER_YEAR4_RE.match(stem)
+        if m:
+            year = stem[m.end() - 4:m.end()]
+        elif _YEAR4_RE.search(stem):
+            continue
         else:
-            m2 = re.match(r'^[a-z]+(\d{2})(?:\D|$)', stem)
-            if not m2:
+            m = _LOWER_YY_RE.match(stem)
+            if not m:
                 continue
-            yy = int(m2.group(1))
+            yy = int(m.group(1))
             year = str(1900 + yy if yy >= 50 else 2000 + yy)
-        by_year.setdefault(year, []).append(stem)
+        has_year_links = True
+        if stem_filter is None or stem_filter.search(stem):
+            by_year.setdefault(year, []).append(stem)
 
     # fallback: probe individual year URLs when index has no links (e.g. UAI)
-    if not by_year:
+    if not has_year_links:
         slug = dblp_key.rsplit("/", 1)[-1]  # "conf/uai" → "uai"
         logger.info(f"  Index page has no year links, probing {slug}YYYY.html...")
-        for year in range(start_year, date.today().year + 2):
+        probe_stems: dict[str, tuple[str, str]] = {}  # probe URL -> (year, stem)
+        if current_year is None:
+            current_year = date.today().year
+        for year in range(start_year, current_year + 2):
             if year < 2000:
                 stem = f"{slug}{year % 100:02d}"
             else:
                 stem = f"{slug}{year}"
-            probe_url = f"{DBLP_DB}/{dblp_key}/{stem}.html"
-            probe = _fetch_with_retry(probe_url)
+            if stem_filter is not None and not stem_filter.search(stem):
+                continue
+            probe_stems[f"{DBLP_DB}/{dblp_key}/{stem}.html"] = (str(year), stem)
+        # probes share the rate limiter, so this only overlaps their latency
+        probes = fetch_parallel(
+            list(probe_stems), _fetch_with_retry,
+            max_workers=_PAGE_WORKERS, default=None, progress_interval=None,
+        )
+        for probe_url, (year, stem) in probe_stems.items():
+            probe = probes[probe_url]
             if probe is not None and probe.status_code == 200:
-                by_year.setdefault(str(year), []).append(stem)
+                by_year.setdefault(year, []).append(stem)
 
+    for year_stems in by_year.values():
+        year_stems.sort()
     return by_year
 
 
-def _fetch_papers_for_stem(stem: str, dblp_key: str) -> list[dict]:
+def _fetch_stem_page(bht_path: str, offset: int, per_page: int, cache_ttl: float) -> dict:
+    """Fetch one page of toc search results; returns the "hits" object or {}."""
+    url = (
+        f"{DBLP_API}"
+        f"?q=toc:{bht_path}:&h={per_page}&f={offset}&format=json"
+    )
+    body = _fetch_cached(url, cache_ttl)
+    if body is None:
+        return {}
+
+    try:
+        data = orjson.loads(body) if orjson is not None else json.loads(body)
+    except ValueError:  # orjson.JSONDecodeError subclasses ValueError
+        logger.warning(f"Non-JSON response from DBLP for {bht_path}")
+        return {}
+    return data.get("result", {}).get("hits", {})
+
+
+def _fetch_papers_for_stem(
+    stem: str,
+    dblp_key: str,
+    cache_ttl: float = INDEX_CACHE_TTL,
+) -> list[dict]:
     """Query DBLP search API for all papers in a single proceedings file.
 
-    Uses pagination (f= offset) to retrieve more than 1000 results.
+    Uses pagination (f= offset) to retrieve more than 1000 results: the
+    first page reports the total, then the remaining pages are fetched
+    concurrently and concatenated in offset order.  Each page is served
+    from the on-disk cache when younger than *cache_ttl*.
     """
     bht_path = f"db/{dblp_key}/{stem}.bht"
-    all_hits: list[dict] = []
-    offset = 0
     per_page = 1000
 
-    while True:
-        url = (
-            f"{DBLP_API}"
-            f"?q=toc:{bht_path}:&h={per_page}&f={offset}&format=json"
-        )
-        resp = _fetch_with_retry(url)
-        if resp is None:
-            break
-
-        try:
-            data = resp.json()
-        except ValueError:
-            logger.warning(f"Non-JSON response from DBLP for {bht_path}")
-            break
+    hits_data = _fetch_stem_page(bht_path, 0, per_page, cache_ttl)
+    total = int(hits_data.get("@total", 0))
+    all_hits: list[dict] = list(hits_data.get("hit", []))
+    if not all_hits:
+        return []
 
-        hits_data = data.get("result", {}).get("hits", {})
-        total = int(hits_data.get("@total", 0))
-        hit_list = hits_data.get("hit", [])
-        if not hit_list:
-            break
+    offsets = list(range(len(all_hits), total, len(all_hits)))
+    if offsets:
+        pages = fetch_parallel(
+            offsets,
+            lambda offset: _fetch_stem_page(bht_path, offset, per_page, cache_ttl).get("hit", []),
+            max_workers=_PAGE_WORKERS,
+            default=[],
+            progress_interval=None,
+        )
+        for offset in offsets:
+            all_hits.extend(pages[offset])
 
-        all_hits.extend(hit_list)
-        offset += len(hit_list)
+    return all_hits
 
-        if offset >= total:
-            break
 
-        time.sleep(0.3)  # be polite between paginated requests
+@lru_cache(maxsize=8192)
+def _normalize_dblp_name(raw: str) -> tuple[str, str]:
+    """Parse a raw DBLP author string into (given, family), memoized.
 
-    return all_hits
+    Prolific authors recur across a proceedings, so repeat names are a
+    dict lookup instead of a fresh parse.
+    """
+    name = raw.strip()
+    # DBLP disambiguation suffix, e.g. "Wei Liu 0005"
+    if len(name) > 5 and name[-4:].isdecimal() and name[-5].isspace():
+        name = name[:-5].rstrip()
+    parsed = parse_author_name(name)
+    return parsed["given"], parsed["family"]
 
 
 def _parse_author(author_data: dict | list) -> dict:
@@ -335,10 +440,8 @@ def _parse_author(author_data: dict | list) -> dict:
     if isinstance(author_data, list):
         author_data = author_data[0] if author_data else {}
 
-    name = author_data.get("text", "").strip()
-    name = re.sub(r'\s+\d{4}$', '', name).strip()  # strip DBLP disambiguation suffix
-
-    return parse_author_name(name)
+    given, family = _normalize_dblp_name(author_data.get("text", ""))
+    return {"given": given, "family": family}
 
 
 def process_venue_year(
@@ -346,19 +449,26 @@ def process_venue_year(
     year: str,
     dblp_key: str,
     stems: list[str],
+    current_year: Optional[int] = None,
 ) -> list[dict]:
     """Fetch and parse all papers for a single venue-year.
 
-    Handles multi-volume proceedings by fetching all stems and merging.
+    Handles multi-volume proceedings by fetching all stems and merging,
+    in the order given (_discover_venue_stems returns them sorted).
+    Years before *current_year* (default: today's) are cached as closed.
     """
     venue_name = DBLP_VENUES[venue_slug]["name"]
+    if current_year is None:
+        current_year = date.today().year
+    closed = year.isdigit() and int(year) < current_year
+    cache_ttl = CLOSED_YEAR_CACHE_TTL if closed else INDEX_CACHE_TTL
 
     if len(stems) > 1:
         logger.info(f"  {venue_slug.upper()} {year}: {len(stems)} volumes")
 
     all_hits: list[dict] = []
-    for stem in sorted(stems):
-        hits = _fetch_papers_for_stem(stem, dblp_key)
+    for stem in stems:
+        hits = _fetch_papers_for_stem(stem, dblp_key, cache_ttl=cache_ttl)
         all_hits.extend(hits)
         if len(stems) > 1:
             logger.info(f"    {stem}: {len(hits)} papers")
@@ -369,7 +479,6 @@ def process_venue_year(
         return []
 
     papers: list[dict] = []
-    bibtex_keys: list[str] = []
 
     for hit in all_hits:
         info = hit.get("info", {})
@@ -378,12 +487,12 @@ def process_venue_year(
         if not title:
             continue
 
-        authors_blob = info.get("authors", {})
-        author_raw = authors_blob.get("author", [])
-        if isinstance(author_raw, dict):
-            author_raw = [author_raw]
+        # single-author papers carry a bare dict instead of a list
+        author_raw = info.get("authors", {}).get("author") or ()
+        if type(author_raw) is dict:
+            author_raw = (author_raw,)
 
-        authors = [_parse_author(a) for a in author_raw]
+        authors = list(map(_parse_author, author_raw))
         if not authors:
             continue
 
@@ -435,11 +544,8 @@ def process_venue_year(
             "source": "dblp",
             "source_id": source_id,
         })
-        bibtex_keys.append(bkey)
 
-    resolved_keys = resolve_bibtex_collisions(bibtex_keys)
-    for paper, key in zip(papers, resolved_keys):
-        paper["bibtex_key"] = key
+    resolve_bibtex_collisions_inplace(papers)
 
     logger.info(f"  {venue_slug.upper()} {year}: {len(papers)} papers")
     return papers
@@ -483,8 +589,9 @@ def fetch_all(
         output_dir = Path("data/backlog") if backlog else Path("data/papers")
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    current_year = date.today().year
     if max_year is None:
-        max_year = date.today().year
+        max_year = current_year
 
     legacy_dir = _find_legacy_dir()
     legacy_venues: set[str] = set()
@@ -495,6 +602,11 @@ def fetch_all(
         if legacy_venues:
             logger.info(f"Legacy data found for: {', '.join(sorted(legacy_venues))}")
 
+    ext = ".jsonl.gz" if backlog else ".json.gz"
+    # one directory listing up front lets fully covered venues skip the
+    # (rate-limited) index request entirely
+    existing_files = {p.name for p in output_dir.iterdir()} if fill_only else set()
+
     jobs: list[tuple] = []
     for venue_slug in venues:
         if venue_slug not in DBLP_VENUES:
@@ -512,21 +624,25 @@ def fetch_all(
             )
             continue
 
+        if fill_only and all(
+            f"{venue_slug}-{y}{ext}" in existing_files
+            for y in range(start_year, max_year + 1)
+        ):
+            logger.info(f"Skipping {venue_slug.upper()}: every year already has an output file")
+            continue
+
         logger.info(f"Discovering {venue_slug.upper()} stems from DBLP ({dblp_key})...")
-        stems_by_year = _discover_venue_stems(dblp_key, start_year=start_year)
+        stem_filter_pattern = venue_info.get("stem_filter", "")
+        stems_by_year = _discover_venue_stems(
+            dblp_key,
+            start_year=start_year,
+            stem_filter=re.compile(stem_filter_pattern) if stem_filter_pattern else None,
+            current_year=current_year,
+        )
         if not stems_by_year:
             logger.warning(f"  No stems found for {venue_slug.upper()}, skipping")
             continue
 
-        stem_filter_pattern = venue_info.get("stem_filter", "")
-        if stem_filter_pattern:
-            sfre = re.compile(stem_filter_pattern)
-            stems_by_year = {
-                y: [s for s in stems if sfre.search(s)]
-                for y, stems in stems_by_year.items()
-            }
-            stems_by_year = {y: s for y, s in stems_by_year.items() if s}
-
         target_years = sorted(
             y for y in stems_by_year
             if start_year <= int(y) <= max_year
@@ -538,7 +654,6 @@ def fetch_all(
 
         for year in target_years:
             venue_year_key = f"{venue_slug}-{year}"
-            ext = ".jsonl.gz" if backlog else ".json.gz"
             out_path = output_dir / f"{venue_year_key}{ext}"
             cache_key = f"dblp-{venue_year_key}"
 
@@ -559,7 +674,7 @@ def fetch_all(
 
     def _fetch_job(venue_slug: str, year: str, dblp_key: str, stems: list[str],
                    out_path: Path, cache_key: str) -> tuple[str, int]:
-        papers = process_venue_year(venue_slug, year, dblp_key, stems)
+        papers = process_venue_year(venue_slug, year, dblp_key, stems, current_year)
         if not papers:
             return f"{venue_slug}-{year}", 0
 
@@ -567,9 +682,13 @@ def fetch_all(
         records = [normalize_paper(p) for p in papers]
         with write_lock:
             if backlog:
-                with gzip.open(out_path, "wt", encoding="utf-8") as f:
-                    for record in records:
-                        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                # one buffered write; level 6 matches write_venue_json
+                if orjson is not None:
+                    buf = b"".join(orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE) for r in records)
+                else:
+                    buf = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records).encode("utf-8")
+                with gzip.open(out_path, "wb", compresslevel=6) as f:
+                    f.write(buf)
                 logger.info(f"  Wrote {out_path}")
             else:
                 write_venue_json(venue_slug, year, records, output_dir)
@@ -14,15 +14,16 @@ Two-phase approach:
 import re
 import logging
 from datetime import date
+from functools import lru_cache
 from html import unescape
 from pathlib import Path
 from typing import Optional
 
 from .common import (
-    make_bibtex_key, resolve_bibtex_collisions, normalize_paper, write_venue_json,
-    strip_html as _strip_html, parse_author_name,
+    make_bibtex_key, resolve_bibtex_collisions, normalize_papers, write_venue_json,
+    load_known_abstracts, strip_html as _strip_html, parse_author_name,
 )
-from .http import fetch_with_retry as _fetch_with_retry, fetch_parallel
+from .http import fetch_with_retry as _fetch_with_retry, fetch_parallel, make_session
 from .cache import should_fetch, mark_fetched
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,11 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://www.ecva.net"
 VENUE_NAME = "Proceedings of the European Conference on Computer Vision (ECCV)"
 
+# Abstract pages are all on ecva.net; one keep-alive pool shared by the
+# workers avoids a TCP + TLS handshake per paper
+ABSTRACT_WORKERS = 32
+_SESSION = make_session(pool_maxsize=ABSTRACT_WORKERS)
+
 # ECCV first appeared on ecva.net in 2018 (even years, biennial)
 _ECCV_START = 2018
 _ECCV_STEP = 2
@@ -50,6 +56,36 @@ def _eccv_years(max_year: Optional[int] = None) -> list[str]:
 # Exported so fetch_all.py can show the count before running
 KNOWN_YEARS = _eccv_years()
 
+# deletes * markers and superscript affiliation numbers:
+# U+00B2 ², U+00B3 ³, U+00B9 ¹, U+2070-U+2079
+_AUTHOR_MARKERS = str.maketrans(
+    "", "", "*\u00b2\u00b3\u00b9" + "".join(map(chr, range(0x2070, 0x207A))),
+)
+_AND_RE = re.compile(r"\s+and\s+")
+
+# index page: one "ECCV <year> Papers" accordion section per edition,
+# one <dt class="ptitle"> block per paper
+_YEAR_HEADING_RE = re.compile(r"ECCV\s+(\d{4})\s+Papers", re.IGNORECASE)
+_PTITLE_RE = re.compile(r'<dt\s+class="ptitle">', re.IGNORECASE)
+# match href with single-quoted, double-quoted, or unquoted paths
+# anchored on papers/eccv_ to avoid grabbing the Springer DOI link
+_TITLE_LINK_RE = re.compile(
+    r'<a\s+href=(?:"(papers/eccv_[^"]+)"|\'(papers/eccv_[^\']+)\'|(papers/eccv_\S+))\s*>'
+    r"\s*(.*?)\s*</a>",
+    re.DOTALL | re.IGNORECASE,
+)
+_WS_RE = re.compile(r"\s+")
+_DD_RE = re.compile(r"<dd>(.*?)</dd>", re.DOTALL)
+_PDF_LINK_RE = re.compile(r"href=['\"]([^'\"]+(?<!-supp)\.pdf)['\"]")
+_SPRINGER_LINK_RE = re.compile(
+    r'href=["\']?(https://link\.springer\.com/chapter/(10\.[^"\'>\s]+))["\']?'
+)
+_PDF_NUM_RE = re.compile(r"/(\d+)\.pdf$")
+_PDF_STEM_RE = re.compile(r"/([^/]+)\.pdf$")
+
+# paper page
+_ABSTRACT_RE = re.compile(r'<div\s+id="abstract">(.*?)</div>', re.DOTALL)
+
 
 def _parse_author_name(name: str) -> dict:
     """Split a name into given/family components, stripping * and superscript markers.
@@ -59,9 +95,7 @@ def _parse_author_name(name: str) -> dict:
     - Unicode superscript affiliation numbers: "Smith ¹²" -> "Smith"
       (U+00B2 ², U+00B3 ³, U+00B9 ¹, U+2070-U+2079 ⁰⁴⁵⁶⁷⁸⁹)
     """
-    name = name.replace("*", "")
-    name = re.sub(r"[\u00b2\u00b3\u00b9\u2070-\u2079]+", "", name).strip()
-    return parse_author_name(name)
+    return parse_author_name(name.translate(_AUTHOR_MARKERS).strip())
 
 
 def _parse_authors(authors_raw: str) -> list[dict]:
@@ -73,10 +107,9 @@ def _parse_authors(authors_raw: str) -> list[dict]:
     Detection: if the text before the first ' and ' contains a comma,
     it's almost certainly bibtex Last-First format.
     """
-    first_and = authors_raw.find(" and ")
-    if first_and > 0 and "," in authors_raw[:first_and]:
+    parts = _AND_RE.split(authors_raw)
+    if len(parts) > 1 and "," in parts[0]:
         # Bibtex format
-        parts = re.split(r"\s+and\s+", authors_raw)
         authors = []
         for part in parts:
             part = part.strip()
@@ -91,49 +124,29 @@ def _parse_authors(authors_raw: str) -> list[dict]:
         return [_parse_author_name(a) for a in authors_raw.split(",") if a.strip()]
 
 
-def _list_papers(year: str) -> list[dict]:
-    """Fetch ecva.net/papers.php and extract all paper entries for a year.
-
-    Returns list of dicts with keys: detail_url, title, authors_raw,
-    pdf_url, source_id.
-    """
-    url = f"{BASE_URL}/papers.php"
-    resp = _fetch_with_retry(url)
-    html = resp.text
-
-    section_pattern = re.compile(
-        rf"ECCV\s+{year}\s+Papers(.*?)(?=ECCV\s+\d{{4}}\s+Papers|$)",
-        re.DOTALL | re.IGNORECASE,
-    )
-    m = section_pattern.search(html)
-    if not m:
-        logger.warning(f"No ECCV {year} section found on {url}")
-        return []
-
-    section = m.group(1)
-
-    blocks = re.split(r'<dt\s+class="ptitle">', section, flags=re.IGNORECASE)[1:]
+def _parse_section(html: str, section_start: int, section_end: int) -> list[dict]:
+    """Extract the paper entries between two offsets of the index page."""
+    # each block runs from one ptitle marker to the next (or the end of the
+    # year's section); fields are searched within those bounds on the page
+    # itself rather than on sliced copies of the section and every block
+    markers = list(_PTITLE_RE.finditer(html, section_start, section_end))
+    ends = [mk.start() for mk in markers[1:]] + [section_end]
 
     papers = []
-    for block in blocks:
-        # match href with single-quoted, double-quoted, or unquoted paths
-        # anchored on papers/eccv_ to avoid grabbing the Springer DOI link
-        title_match = re.search(
-            r'<a\s+href=(?:"(papers/eccv_[^"]+)"|\'(papers/eccv_[^\']+)\'|(papers/eccv_\S+))\s*>'
-            r"\s*(.*?)\s*</a>",
-            block,
-            re.DOTALL | re.IGNORECASE,
-        )
+    for marker, end in zip(markers, ends):
+        start = marker.end()
+        title_match = _TITLE_LINK_RE.search(html, start, end)
         if not title_match:
             continue
 
         detail_rel = title_match.group(1) or title_match.group(2) or title_match.group(3)
-        title = unescape(re.sub(r"\s+", " ", title_match.group(4)).strip())
+        title = unescape(_WS_RE.sub(" ", title_match.group(4)).strip())
         if title.startswith('"') and title.endswith('"'):
             title = title[1:-1]
         detail_url = f"{BASE_URL}/{detail_rel.lstrip('/')}"
 
-        dd_contents = re.findall(r"<dd>(.*?)</dd>", block, re.DOTALL)
+        # the <dd> fields follow the title's <dt>, so resume from the link
+        dd_contents = _DD_RE.findall(html, title_match.end(), end)
         if not dd_contents:
             continue
 
@@ -143,27 +156,22 @@ def _list_papers(year: str) -> list[dict]:
         doi = ""
         if len(dd_contents) > 1:
             links_html = dd_contents[1]
-            pdf_match = re.search(
-                r"href=['\"]([^'\"]+(?<!-supp)\.pdf)['\"]", links_html
-            )
+            pdf_match = _PDF_LINK_RE.search(links_html)
             if pdf_match:
                 pdf_rel = pdf_match.group(1)
                 pdf_url = f"{BASE_URL}/{pdf_rel.lstrip('/')}"
 
-            springer_match = re.search(
-                r'href=["\']?(https://link\.springer\.com/chapter/(10\.[^"\'>\s]+))["\']?',
-                links_html,
-            )
+            springer_match = _SPRINGER_LINK_RE.search(links_html)
             if springer_match:
                 doi = springer_match.group(2)
 
         source_id = ""
         if pdf_url:
-            fname_match = re.search(r"/(\d+)\.pdf$", pdf_url)
+            fname_match = _PDF_NUM_RE.search(pdf_url)
             if fname_match:
                 source_id = fname_match.group(1)
             else:
-                stem_match = re.search(r"/([^/]+)\.pdf$", pdf_url)
+                stem_match = _PDF_STEM_RE.search(pdf_url)
                 if stem_match:
                     source_id = stem_match.group(1)
 
@@ -179,24 +187,65 @@ def _list_papers(year: str) -> list[dict]:
     return papers
 
 
+@lru_cache(maxsize=1)
+def _load_index() -> dict[str, list[dict]]:
+    """Fetch ecva.net/papers.php once and parse every year's section.
+
+    The page lists all editions, so a multi-year run only needs to download
+    it a single time.  Returns {year: [entry dicts]}.
+    """
+    resp = _fetch_with_retry(f"{BASE_URL}/papers.php", session=_SESSION)
+    html = resp.text
+
+    # one sweep over the headings: each year's section runs from its heading
+    # to the next one (any year) or the end of the page
+    headings = list(_YEAR_HEADING_RE.finditer(html))
+    ends = [h.start() for h in headings[1:]] + [len(html)]
+
+    index = {}
+    for heading, end in zip(headings, ends):
+        year = heading.group(1)
+        if year not in index:
+            index[year] = _parse_section(html, heading.end(), end)
+    return index
+
+
+def _list_papers(year: str) -> list[dict]:
+    """Return all paper entries for a year from the ecva.net index page.
+
+    Returns list of dicts with keys: detail_url, title, authors_raw,
+    pdf_url, doi, source_id.
+    """
+    index = _load_index()
+    if year not in index:
+        logger.warning(f"No ECCV {year} section found on {BASE_URL}/papers.php")
+        return []
+    return index[year]
+
+
 def _fetch_abstract(detail_url: str) -> str:
     """Fetch an individual paper page and extract the abstract."""
     try:
-        resp = _fetch_with_retry(detail_url)
+        resp = _fetch_with_retry(detail_url, session=_SESSION)
     except (FileNotFoundError, RuntimeError):
         return ""
 
-    m = re.search(r'<div\s+id="abstract">(.*?)</div>', resp.text, re.DOTALL)
+    m = _ABSTRACT_RE.search(resp.text)
     if not m:
         return ""
 
-    abstract = _strip_html(m.group(1)).strip()
-    abstract = abstract.strip('\u201c\u201d"').strip()
-    return abstract
+    # strip_html already trims whitespace; only the wrapping quotes remain
+    return _strip_html(m.group(1)).strip('\u201c\u201d"').strip()
 
 
-def process_year(year: str) -> list[dict]:
-    """Fetch and parse all ECCV papers for a given year."""
+def process_year(year: str, known_abstracts: Optional[dict[str, str]] = None) -> list[dict]:
+    """Fetch and parse all ECCV papers for a given year.
+
+    Args:
+        year: Year string.
+        known_abstracts: Abstracts from a previous run, keyed by detail page
+            URL; those pages are not fetched again.
+    """
     logger.info(f"Processing ECCV {year}")
 
     entries = _list_papers(year)
@@ -204,12 +253,18 @@ def process_year(year: str) -> list[dict]:
         logger.warning(f"  No papers found for ECCV {year}")
         return []
 
+    known = known_abstracts or {}
+    detail_urls = [e["detail_url"] for e in entries if e["detail_url"] not in known]
     logger.info(f"  Found {len(entries)} papers, fetching abstracts...")
+    if known:
+        logger.info(f"  Reusing {len(entries) - len(detail_urls)} abstracts from the previous run")
 
-    detail_urls = [e["detail_url"] for e in entries]
-    abstracts = fetch_parallel(
-        detail_urls, _fetch_abstract, max_workers=20, progress_interval=100,
-    )
+    abstracts = {}
+    if detail_urls:
+        abstracts = fetch_parallel(
+            detail_urls, _fetch_abstract, max_workers=ABSTRACT_WORKERS, progress_interval=100,
+        )
+    abstracts = {**known, **abstracts}
 
     papers = []
     bibtex_keys = []
@@ -283,11 +338,18 @@ def fetch_all(
             logger.info(f"Skipping ECCV {year} — cached")
             continue
 
-        papers = process_year(year)
+        # --force (no cache) re-fetches every abstract too
+        known_abstracts = None
+        if cache is not None:
+            known_abstracts = load_known_abstracts(output_dir / f"eccv-{year}.json.gz", "venue_url")
+
+        papers = process_year(year, known_abstracts=known_abstracts)
 
         if papers:
             all_papers[f"eccv-{year}"] = papers
-            write_venue_json("eccv", year, [normalize_paper(p) for p in papers], output_dir)
+            # in-process: forking a process pool here would copy a process
+            # whose HTTP session and abstract workers may be holding locks
+            write_venue_json("eccv", year, normalize_papers(papers, max_workers=1), output_dir)
             if cache is not None:
                 mark_fetched(cache, cache_key)
 
@@ -311,7 +373,7 @@ if __name__ == "__main__":
         papers = process_year(args.year)
         output_dir = Path(args.output)
         output_dir.mkdir(parents=True, exist_ok=True)
-        out_path = write_venue_json("eccv", args.year, [normalize_paper(p) for p in papers], output_dir)
+        out_path = write_venue_json("eccv", args.year, normalize_papers(papers), output_dir)
         print(f"Wrote {len(papers)} papers to {out_path}")
     elif args.all:
         fetch_all(output_dir=Path(args.output), max_year=args.max_year)
@@ -25,11 +25,17 @@ Usage:
 
 import logging
 import time
+from functools import partial
 from typing import Optional
 
 import requests
 
-from .http import fetch_with_retry as _fetch_with_retry
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .http import RateLimiter, fetch_parallel, fetch_with_retry as _fetch_with_retry, make_session
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +47,14 @@ ELSEVIER_DOI_PREFIXES = ("10.1016/", "10.1006/")
 # Conservative rate: 10 req/s leaves plenty of headroom under 10k/week
 MIN_REQUEST_INTERVAL = 0.1  # seconds between requests
 
+# a few requests in flight overlap per-request latency; the shared limiter
+# still caps total throughput at the rate above
+MAX_WORKERS = 4
+
+# one keep-alive session and one request budget for all DOI lookups in a run
+_SESSION = make_session(pool_maxsize=MAX_WORKERS)
+_RATE_LIMITER = RateLimiter(1 / MIN_REQUEST_INTERVAL)
+
 
 def fetch_by_doi(doi: str, api_key: str) -> Optional[dict]:
     """Fetch abstract for a single DOI from the Elsevier full-text API.
@@ -53,14 +67,15 @@ def fetch_by_doi(doi: str, api_key: str) -> Optional[dict]:
 
     resp = _fetch_with_retry(
         url, params=params, max_retries=4, return_none_on_404=True,
-        rate_limit_codes=(429, 500, 502, 503, 504),
+        rate_limit_codes=(429, 500, 502, 503, 504), session=_SESSION,
+        rate_limiter=_RATE_LIMITER,
     )
     if resp is None:
         return None
 
     try:
-        data = resp.json()
-    except ValueError:
+        data = orjson.loads(resp.content) if orjson is not None else resp.json()
+    except ValueError:  # orjson.JSONDecodeError subclasses ValueError
         return None
 
     core = data.get("full-text-retrieval-response", {}).get("coredata", {})
@@ -85,13 +100,11 @@ def fetch_batch(
     Returns:
         Dict mapping DOI -> {"abstract": str}.
     """
-    to_fetch = [
-        p["doi"].strip()
-        for p in papers
-        if p.get("doi", "").strip()
-        and any(p["doi"].strip().startswith(pfx) for pfx in ELSEVIER_DOI_PREFIXES)
-        and not p.get("abstract", "").strip()
-    ]
+    to_fetch = []
+    for p in papers:
+        doi = p.get("doi", "").strip()
+        if doi.startswith(ELSEVIER_DOI_PREFIXES) and not p.get("abstract", "").strip():
+            to_fetch.append(doi)
 
     if not to_fetch:
         logger.info("  No papers need Elsevier enrichment")
@@ -99,38 +112,19 @@ def fetch_batch(
 
     logger.info(f"  Fetching {len(to_fetch)} papers from Elsevier...")
 
-    results: dict[str, dict] = {}
-    found = 0
-    errors = 0
     t_start = time.time()
-    last_request_time = 0.0
-
-    for i, doi in enumerate(to_fetch):
-        elapsed = time.time() - last_request_time
-        if elapsed < MIN_REQUEST_INTERVAL:
-            time.sleep(MIN_REQUEST_INTERVAL - elapsed)
-
-        last_request_time = time.time()
-        result = fetch_by_doi(doi, api_key)
-
-        if result is not None:
-            results[doi] = result
-            found += 1
-        else:
-            errors += 1
-
-        if (i + 1) % 50 == 0 or i + 1 == len(to_fetch):
-            elapsed_total = time.time() - t_start
-            rate = (i + 1) / elapsed_total if elapsed_total > 0 else 0
-            logger.info(
-                f"  Elsevier: {i + 1}/{len(to_fetch)} queried, "
-                f"{found} found, {errors} errors "
-                f"({rate:.1f} req/s)"
-            )
+    # workers share _RATE_LIMITER, so total throughput stays at the polite rate
+    fetched = fetch_parallel(
+        list(dict.fromkeys(to_fetch)), partial(fetch_by_doi, api_key=api_key),
+        max_workers=MAX_WORKERS, default=None, progress_interval=50,
+    )
+    results = {doi: result for doi, result in fetched.items() if result is not None}
+    found = len(results)
+    errors = len(fetched) - found
 
     elapsed_total = time.time() - t_start
     logger.info(
-        f"  Elsevier done: {found}/{len(to_fetch)} found "
+        f"  Elsevier done: {found}/{len(fetched)} found "
         f"in {elapsed_total:.0f}s ({errors} errors)"
     )
     return results
@@ -1,18 +1,89 @@
 """Shared HTTP utilities for all adapters.
 
-Provides fetch_with_retry() for exponential backoff and fetch_parallel()
-for concurrent item fetching with progress logging.
+Provides fetch_with_retry() for exponential backoff, fetch_parallel()
+for concurrent item fetching with progress logging, make_session()
+for keep-alive connection reuse across many requests, and
+RateLimiter for pacing requests shared between worker threads.
 """
 
 import logging
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Callable, Optional
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# longest server Retry-After we honour; beyond it (e.g. a misbehaving
+# mirror asking for a day) fall back to our own backoff schedule
+MAX_RETRY_AFTER = 120
+
+
+def make_session(
+    headers: Optional[dict] = None,
+    pool_maxsize: int = 10,
+) -> requests.Session:
+    """Create a requests.Session that reuses connections across calls.
+
+    Reusing one session avoids a fresh TCP + TLS handshake per request.
+    Retries are left to fetch_with_retry(), so the transport adapter's own
+    retry is disabled.
+
+    Args:
+        headers: Default headers sent with every request.
+        pool_maxsize: Connections kept open per host; match this to the
+            caller's concurrency.
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    # pool_connections is the number of per-host pools kept; sessions such
+    # as PMLR's (api.github.com + raw.githubusercontent.com) alternate hosts
+    adapter = HTTPAdapter(
+        pool_connections=DEFAULT_POOLSIZE, pool_maxsize=pool_maxsize, max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces requests at most *rate* per second.
+
+    Each wait() call reserves the next free slot under a lock and sleeps
+    outside it, so concurrent workers share one request budget without
+    serialising their network I/O.  pause() pushes every future slot back,
+    e.g. after a 429, so sibling threads back off too, and set_rate()
+    retunes the spacing while workers are running.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller may send its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the allowed rate, e.g. to follow a server-advertised limit."""
+        with self._lock:
+            self.interval = 1.0 / rate
+
+    def pause(self, seconds: float) -> None:
+        """Hold off all callers for at least *seconds* from now."""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
 
 def fetch_with_retry(
     url: str,
@@ -24,6 +95,8 @@ def fetch_with_retry(
     params: Optional[dict] = None,
     method: str = "GET",
     json_body: Optional[dict] = None,
+    session: Optional[requests.Session] = None,
+    rate_limiter: Optional[RateLimiter] = None,
 ) -> requests.Response:
     """Fetch URL with exponential backoff.
 
@@ -32,11 +105,17 @@ def fetch_with_retry(
         headers: Optional request headers.
         max_retries: Number of retry attempts.
         timeout: Request timeout in seconds.
-        rate_limit_codes: HTTP status codes that trigger backoff.
+        rate_limit_codes: HTTP status codes that trigger backoff.  A numeric
+            Retry-After header on these responses sets the wait, up to
+            MAX_RETRY_AFTER seconds.
         return_none_on_404: If True, return None instead of raising on 404.
         params: Optional query parameters.
         method: HTTP method (GET or POST).
         json_body: Optional JSON body for POST requests.
+        session: Optional session (see make_session) for connection reuse.
+            Falls back to one-shot requests.get/post when None.
+        rate_limiter: Optional shared limiter, waited on before every
+            attempt and paused on rate-limit responses.
 
     Returns:
         requests.Response on success.
@@ -45,14 +124,17 @@ def fetch_with_retry(
         FileNotFoundError: On 404 (unless return_none_on_404 is True).
         RuntimeError: After exhausting all retries.
     """
+    client = session if session is not None else requests
     for attempt in range(max_retries):
         try:
+            if rate_limiter is not None:
+                rate_limiter.wait()
             if method.upper() == "POST":
-                resp = requests.post(
+                resp = client.post(
                     url, headers=headers, params=params, json=json_body, timeout=timeout,
                 )
             else:
-                resp = requests.get(
+                resp = client.get(
                     url, headers=headers, params=params, timeout=timeout,
                 )
             if resp.status_code == 200:
@@ -70,8 +152,16 @@ def fetch_with_retry(
                     return None
                 raise FileNotFoundError(f"Not found: {url}")
             if resp.status_code in rate_limit_codes:
-                wait = 2 ** (attempt + 1)
+                # prefer the server's Retry-After (delta-seconds form) over
+                # our own backoff schedule when it sends a sane one
+                retry_after = resp.headers.get("Retry-After", "").strip()
+                if retry_after.isdecimal() and int(retry_after) <= MAX_RETRY_AFTER:
+                    wait = int(retry_after)
+                else:
+                    wait = 2 ** (attempt + 1)
                 logger.warning(f"HTTP {resp.status_code} on {url}, waiting {wait}s")
+                if rate_limiter is not None:
+                    rate_limiter.pause(wait)
                 time.sleep(wait)
                 continue
             resp.raise_for_status()
@@ -92,7 +182,7 @@ def fetch_parallel(
     *,
     max_workers: int = 10,
     default: Any = "",
-    progress_interval: int = 100,
+    progress_interval: Optional[int] = 100,
 ) -> dict:
     """Call fn(key) in parallel for each key, returning {key: result}.
 
@@ -103,7 +193,8 @@ def fetch_parallel(
         fn: Callable that takes a single key and returns a result.
         max_workers: ThreadPoolExecutor concurrency.
         default: Value to use when fn raises an exception.
-        progress_interval: Log progress every N completed items.
+        progress_interval: Log progress every N completed items; None or 0
+            turns progress logging off.
     """
     results: dict = {}
     total = len(keys)
@@ -119,7 +210,7 @@ def fetch_parallel(
             except Exception as e:
                 logger.warning(f"  Failed to fetch {key}: {e}")
                 results[key] = default
-            if done % progress_interval == 0:
+            if progress_interval and done % progress_interval == 0:
                 logger.info(f"  Progress: {done}/{total}")
 
     return results
@@ -17,12 +17,17 @@ Usage::
 """
 
 import logging
-import time
 import urllib.parse
 from typing import Optional
 
-from .common import make_bibtex_key, resolve_bibtex_collisions, parse_author_name
-from .http import fetch_with_retry
+# optional: C-level JSON decoder, falls back to resp.json()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .common import make_bibtex_key, resolve_bibtex_collisions_inplace, parse_author_name
+from .http import RateLimiter, fetch_parallel, fetch_with_retry
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +40,18 @@ YEARS = ["2019", "2020", "2021", "2022", "2023", "2024", "2025"]
 
 VENUE_FULLNAME = "International Conference on Learning Representations Workshops"
 
+_HEADERS = {"User-Agent": "mlanthology/1.0"}
+
+# workshops are independent venues, so they are fetched concurrently; all
+# workers share one request budget to stay polite to OpenReview
+WORKSHOP_WORKERS = 8
+MIN_REQUEST_INTERVAL = 0.2  # seconds between requests, across all workers
+_RATE_LIMITER = RateLimiter(1 / MIN_REQUEST_INTERVAL)
+
+# notes per page; pages after the first are fetched concurrently
+NOTES_PAGE_SIZE = 1000
+_PAGE_WORKERS = 4
+
 
 def _api(year: str) -> str:
     return ORAPI_V2 if int(year) >= 2024 else ORAPI_V1
@@ -58,8 +75,11 @@ def _list_workshop_ids(year: str) -> list[tuple[str, str]]:
         # v1: parent parameter lists direct children
         url = f"{base}/groups?parent={urllib.parse.quote(parent, safe='/:.')}&limit=500"
 
-    resp = fetch_with_retry(url, headers={"User-Agent": "mlanthology/1.0"}, max_retries=5)
-    data = resp.json()
+    resp = fetch_with_retry(
+        url, headers=_HEADERS, max_retries=5,
+        rate_limiter=_RATE_LIMITER,
+    )
+    data = orjson.loads(resp.content) if orjson is not None else resp.json()
     groups = data.get("groups", [])
     results = []
     for g in groups:
@@ -70,57 +90,67 @@ def _list_workshop_ids(year: str) -> list[tuple[str, str]]:
     return results
 
 
+def _fetch_notes_page(page_url: str, offset: int) -> dict:
+    """Fetch one page of notes; *page_url* ends in "&offset="."""
+    resp = fetch_with_retry(
+        page_url + str(offset), headers=_HEADERS, max_retries=5,
+        rate_limiter=_RATE_LIMITER,
+    )
+    return orjson.loads(resp.content) if orjson is not None else resp.json()
+
+
+def _fetch_note_batches(base: str, venue_id: str) -> list[list[dict]]:
+    """Fetch every page of notes for a venue, as batches in offset order.
+
+    The first page reports the total count, so the remaining offsets are
+    known up front and fetched concurrently.
+
+    Raises:
+        RuntimeError: If any later page fails, so the workshop is reported
+            as failed rather than silently truncated.
+    """
+    # everything but the offset is fixed per venue, so encode it once
+    page_url = (
+        f"{base}/notes"
+        f"?content.venueid={urllib.parse.quote(venue_id, safe='/:.')}"
+        f"&limit={NOTES_PAGE_SIZE}&offset="
+    )
+    first = _fetch_notes_page(page_url, 0)
+    batches = [first.get("notes", [])]
+    step = len(batches[0])
+    if not step:
+        return batches
+
+    offsets = list(range(step, first.get("count", 0), step))
+    if offsets:
+        pages = fetch_parallel(
+            offsets,
+            lambda offset: _fetch_notes_page(page_url, offset).get("notes", []),
+            max_workers=_PAGE_WORKERS,
+            default=None,
+            progress_interval=None,
+        )
+        for offset in offsets:
+            if pages[offset] is None:
+                raise RuntimeError(f"Failed to fetch notes for {venue_id} at offset {offset}")
+            batches.append(pages[offset])
+    return batches
+
+
 def _fetch_notes_v2(venue_id: str) -> list[dict]:
     """Fetch all notes for a v2 workshop venue."""
-    all_notes = []
-    offset = 0
-    limit = 1000
-    vid_enc = urllib.parse.quote(venue_id, safe="/:.")
-    while True:
-        url = (
-            f"{ORAPI_V2}/notes"
-            f"?content.venueid={vid_enc}"
-            f"&limit={limit}&offset={offset}"
-        )
-        resp = fetch_with_retry(url, headers={"User-Agent": "mlanthology/1.0"}, max_retries=5)
-        data = resp.json()
-        batch = data.get("notes", [])
-        all_notes.extend(batch)
-        total = data.get("count", 0)
-        offset += len(batch)
-        if offset >= total or not batch:
-            break
-        time.sleep(0.5)
-    return all_notes
+    return [n for batch in _fetch_note_batches(ORAPI_V2, venue_id) for n in batch]
 
 
 def _fetch_notes_v1(venue_id: str) -> list[dict]:
     """Fetch notes for a v1 workshop venue, filtering to accepted-only."""
     all_notes = []
-    offset = 0
-    limit = 1000
-    vid_enc = urllib.parse.quote(venue_id, safe="/:.")
-    while True:
-        url = (
-            f"{ORAPI_V1}/notes"
-            f"?content.venueid={vid_enc}"
-            f"&limit={limit}&offset={offset}"
-        )
-        resp = fetch_with_retry(url, headers={"User-Agent": "mlanthology/1.0"}, max_retries=5)
-        data = resp.json()
-        batch = data.get("notes", [])
+    for batch in _fetch_note_batches(ORAPI_V1, venue_id):
         # Filter out papers still under review ("Submitted to …")
-        accepted = []
         for n in batch:
             venue_label = n.get("content", {}).get("venue", "")
             if "submitted" not in venue_label.lower() and venue_label != "":
-                accepted.append(n)
-        all_notes.extend(accepted)
-        total = data.get("count", 0)
-        offset += len(batch)
-        if offset >= total or not batch:
-            break
-        time.sleep(0.5)
+                all_notes.append(n)
     return all_notes
 
 
@@ -131,7 +161,7 @@ def _parse_note_v2(note: dict, year: str, venue_name: str) -> Optional[dict]:
     if not title:
         return None
     author_names = c.get("authors", {}).get("value", [])
-    authors = [parse_author_name(n) for n in author_names]
+    authors = list(map(parse_author_name, author_names))
     if not authors:
         return None
     abstract = c.get("abstract", {}).get("value", "")
@@ -176,7 +206,7 @@ def _parse_note_v1(note: dict, year: str, venue_name: str) -> Optional[dict]:
     if not title:
         return None
     author_names = c.get("authors", [])
-    authors = [parse_author_name(n) for n in author_names]
+    authors = list(map(parse_author_name, author_names))
     if not authors:
         return None
     abstract = c.get("abstract", "")
@@ -227,35 +257,33 @@ def fetch_year(year: str) -> list[dict]:
     workshop_ids = _list_workshop_ids(year)
     logger.info(f"  Found {len(workshop_ids)} workshops for {year}")
 
-    all_papers: list[dict] = []
-    all_bkeys: list[str] = []
+    parse_fn = _parse_note_v2 if is_v2 else _parse_note_v1
+    fetch_notes = _fetch_notes_v2 if is_v2 else _fetch_notes_v1
 
-    for venue_id, code in workshop_ids:
+    def fetch_workshop(workshop: tuple[str, str]) -> list[dict]:
+        venue_id, code = workshop
         workshop_name = f"ICLR {year} Workshops: {code}"
         logger.info(f"  Fetching {venue_id}...")
-        try:
-            if is_v2:
-                notes = _fetch_notes_v2(venue_id)
-                parse_fn = _parse_note_v2
-            else:
-                notes = _fetch_notes_v1(venue_id)
-                parse_fn = _parse_note_v1
-
-            for note in notes:
-                paper = parse_fn(note, year, workshop_name)
-                if paper is not None:
-                    all_papers.append(paper)
-                    all_bkeys.append(paper["bibtex_key"])
-
-            logger.info(f"    -> {len(notes)} notes, {sum(1 for p in all_papers if p['venue_name'] == workshop_name)} parsed")
-            time.sleep(1)  # polite delay between workshops
-        except Exception as e:
-            logger.warning(f"  Failed to fetch {venue_id}: {e}")
+        notes = fetch_notes(venue_id)
+        papers = []
+        for note in notes:
+            paper = parse_fn(note, year, workshop_name)
+            if paper is not None:
+                papers.append(paper)
+        logger.info(f"    {venue_id} -> {len(notes)} notes, {len(papers)} parsed")
+        return papers
+
+    # failed workshops are logged by fetch_parallel and contribute no papers
+    by_workshop = fetch_parallel(
+        workshop_ids, fetch_workshop,
+        max_workers=WORKSHOP_WORKERS, default=[], progress_interval=None,
+    )
+
+    # assemble in listing order so collision suffixes are stable across runs
+    all_papers = [p for w in workshop_ids for p in by_workshop[w]]
 
     # Resolve bibtex key collisions across all workshops
-    resolved = resolve_bibtex_collisions(all_bkeys)
-    for paper, key in zip(all_papers, resolved):
-        paper["bibtex_key"] = key
+    resolve_bibtex_collisions_inplace(all_papers)
 
     return all_papers
 
@@ -28,11 +28,19 @@ Usage:
 
 import logging
 import time
+from functools import partial
 from typing import Optional
 
 import requests
 
+# optional: C-level JSON decoder, falls back to resp.json()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .common import get_api_key as _get_api_key_from
+from .http import RateLimiter, fetch_parallel, make_session
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +57,18 @@ _HEADERS = {
 # daily cap enforced by the caller.
 MIN_REQUEST_INTERVAL = 0.15  # seconds between requests
 
+# a few requests in flight overlap per-request latency; the shared limiter
+# keeps total throughput under the per-second cap
+MAX_WORKERS = 4
+
+# one keep-alive session and one request budget for all DOI lookups in a run
+_SESSION = make_session(_HEADERS, pool_maxsize=MAX_WORKERS)
+_RATE_LIMITER = RateLimiter(1 / MIN_REQUEST_INTERVAL)
+
+# DOIs in the first wave; if none of them succeed the key is likely bad,
+# so the rest of the daily quota is not spent
+_PROBE_SIZE = 10
+
 # IEEE venues — sorted smallest-missing-abstract first to maximise
 # coverage with the tight 200 req/day free-tier quota.
 IEEE_VENUES = ["wacvw", "wacv", "iccvw", "cvprw", "iccv", "cvpr"]
@@ -89,14 +109,13 @@ def fetch_by_doi(
 
     for attempt in range(max_retries):
         try:
-            resp = requests.get(
-                IEEE_API, params=params, headers=_HEADERS, timeout=30
-            )
+            _RATE_LIMITER.wait()
+            resp = _SESSION.get(IEEE_API, params=params, timeout=30)
 
             if resp.status_code == 200:
                 try:
-                    data = resp.json()
-                except ValueError:
+                    data = orjson.loads(resp.content) if orjson is not None else resp.json()
+                except ValueError:  # orjson.JSONDecodeError subclasses ValueError
                     logger.warning(f"IEEE: invalid JSON for doi:{doi}")
                     return None
 
@@ -129,6 +148,8 @@ def fetch_by_doi(
             if resp.status_code == 429:
                 wait = 2 ** (attempt + 1)
                 logger.warning(f"IEEE: rate limited (429), waiting {wait}s")
+                # push the shared limiter back so sibling workers wait too
+                _RATE_LIMITER.pause(wait)
                 time.sleep(wait)
                 continue
 
@@ -190,13 +211,16 @@ def fetch_batch(
         )
         return {}
 
-    # Select papers that need enrichment
+    # Select papers that need enrichment; a DOI shared by several records
+    # (e.g. a paper listed in two venues) costs only one request of quota
     to_fetch: list[str] = []
+    seen: set[str] = set()
     for p in papers:
         doi = p.get("doi", "").strip()
-        if not doi or not _is_ieee_doi(doi):
+        if not doi or doi in seen or not _is_ieee_doi(doi):
             continue
         if needs_abstract and not p.get("abstract", "").strip():
+            seen.add(doi)
             to_fetch.append(doi)
 
     if not to_fetch:
@@ -214,43 +238,44 @@ def fetch_batch(
     results: dict[str, dict] = {}
     found = 0
     errors = 0
+    queried = 0
     t_start = time.time()
-    last_request_time = 0.0
-
-    for i, doi in enumerate(to_fetch[:daily_limit]):
-        # Rate limiting
-        elapsed = time.time() - last_request_time
-        if elapsed < MIN_REQUEST_INTERVAL:
-            time.sleep(MIN_REQUEST_INTERVAL - elapsed)
 
-        last_request_time = time.time()
-        result = fetch_by_doi(doi, key)
-
-        if result is not None:
-            results[doi] = result
-            if result.get("abstract"):
-                found += 1
-        else:
-            errors += 1
+    batch = to_fetch[:daily_limit]
+    probe, rest = batch[:_PROBE_SIZE], batch[_PROBE_SIZE:]
+    for wave in (probe, rest):
+        if not wave:
+            continue
+        # workers share _RATE_LIMITER, so throughput stays under the API cap
+        fetched = fetch_parallel(
+            wave, partial(fetch_by_doi, api_key=key),
+            max_workers=MAX_WORKERS, default=None, progress_interval=50,
+        )
+        for doi, result in fetched.items():
+            if result is not None:
+                results[doi] = result
+                if result.get("abstract"):
+                    found += 1
+            else:
+                errors += 1
+        queried += len(fetched)
+
+        elapsed_total = time.time() - t_start
+        rate = queried / elapsed_total if elapsed_total > 0 else 0
+        logger.info(
+            f"  IEEE: {queried}/{effective} queried, "
+            f"{found} with abstracts, {errors} errors "
+            f"({rate:.1f} req/s)"
+        )
 
         # Abort early if the API key appears invalid (many errors, zero hits)
-        if i == 9 and found == 0 and errors >= 8:
+        if wave is probe and len(probe) == _PROBE_SIZE and found == 0 and errors >= 8:
             logger.error(
                 "  IEEE: aborting — too many early errors "
                 "(check API key; it may still be pending activation)"
             )
             break
 
-        # Progress logging
-        if (i + 1) % 50 == 0 or i + 1 == effective:
-            elapsed_total = time.time() - t_start
-            rate = (i + 1) / elapsed_total if elapsed_total > 0 else 0
-            logger.info(
-                f"  IEEE: {i+1}/{effective} queried, "
-                f"{found} with abstracts, {errors} errors "
-                f"({rate:.1f} req/s)"
-            )
-
     elapsed_total = time.time() - t_start
     remaining = len(to_fetch) - min(len(to_fetch), daily_limit)
     logger.info(
@@ -281,6 +306,8 @@ def enrich_papers(
         Number of papers that had at least one field filled in.
     """
     results = fetch_batch(papers, api_key=api_key, daily_limit=daily_limit)
+    if not results:
+        return 0
 
     enriched = 0
     for paper in papers:
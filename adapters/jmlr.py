@@ -25,7 +25,7 @@ from .common import (
     parse_author_name as _parse_author_name,
     strip_html as _strip_html,
 )
-from .http import fetch_with_retry as _fetch_with_retry, fetch_parallel
+from .http import fetch_with_retry as _fetch_with_retry, fetch_parallel, make_session
 from .cache import should_fetch, mark_fetched
 
 logger = logging.getLogger(__name__)
@@ -35,6 +35,11 @@ DMLR_BASE_URL = "https://data.mlr.press"
 VENUE_NAME = "Journal of Machine Learning Research"
 DMLR_VENUE_NAME = "Journal of Data-centric Machine Learning Research"
 
+# Abstract pages are fetched concurrently from jmlr.org; size the
+# keep-alive pool to the worker count
+ABSTRACT_WORKERS = 8
+_SESSION = make_session(pool_maxsize=ABSTRACT_WORKERS)
+
 # JMLR volumes: (volume_number, year)
 # Volume 1 started in 2000. Some volumes span two years.
 KNOWN_VOLUMES = [
@@ -76,7 +81,7 @@ def _list_papers_from_volume(volume: int) -> list[dict]:
     year, is_mloss, code_url, pdf_url.
     """
     url = f"{BASE_URL}/papers/v{volume}/"
-    resp = _fetch_with_retry(url)
+    resp = _fetch_with_retry(url, session=_SESSION)
     html = resp.text
 
     dl_blocks = re.findall(r"<dl>(.*?)</dl>", html, re.DOTALL)
@@ -177,7 +182,7 @@ def _fetch_abstract(volume: int, paper_id: str) -> str:
     """Fetch abstract from a JMLR paper detail page."""
     url = f"{BASE_URL}/papers/v{volume}/{paper_id}.html"
     try:
-        resp = _fetch_with_retry(url)
+        resp = _fetch_with_retry(url, session=_SESSION)
     except (FileNotFoundError, RuntimeError):
         return ""
 
@@ -205,7 +210,7 @@ def _fetch_abstract(volume: int, paper_id: str) -> str:
     return ""
 
 
-def _fetch_abstracts_parallel(volume: int, paper_ids: list[str], max_workers: int = 8) -> dict[str, str]:
+def _fetch_abstracts_parallel(volume: int, paper_ids: list[str], max_workers: int = ABSTRACT_WORKERS) -> dict[str, str]:
     """Fetch abstracts for multiple papers in parallel."""
     return fetch_parallel(
         paper_ids,
@@ -299,7 +304,7 @@ def _list_dmlr_papers(volume: int) -> list[dict]:
     """Parse DMLR volume listing page. Abstracts are inline."""
     vol_str = f"{volume:02d}"
     url = f"{DMLR_BASE_URL}/volumes/{vol_str}.html"
-    resp = _fetch_with_retry(url)
+    resp = _fetch_with_retry(url, session=_SESSION)
     html = resp.text
 
     papers = []
@@ -16,7 +16,7 @@ from .common import (
     make_bibtex_key, resolve_bibtex_collisions, normalize_paper, write_venue_json,
     parse_author_name as _parse_author_name, strip_html as _strip_html,
 )
-from .http import fetch_with_retry as _fetch_with_retry, fetch_parallel
+from .http import fetch_with_retry as _fetch_with_retry, fetch_parallel, make_session
 from .cache import should_fetch, mark_fetched
 
 logger = logging.getLogger(__name__)
@@ -24,6 +24,11 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://proceedings.neurips.cc"
 VENUE_NAME = "Advances in Neural Information Processing Systems"
 
+# Paper pages are fetched concurrently from one host; size the keep-alive
+# pool to the worker count so no worker has to open its own connection
+PAPER_WORKERS = 20
+_SESSION = make_session(pool_maxsize=PAPER_WORKERS)
+
 # All NeurIPS/NIPS years available on proceedings.neurips.cc
 KNOWN_YEARS = [str(y) for y in range(1987, 2025)]
 
@@ -34,7 +39,7 @@ def _list_papers(year: str) -> list[dict]:
     Returns list of dicts with keys: hash, title, authors_str, track.
     """
     url = f"{BASE_URL}/paper/{year}"
-    resp = _fetch_with_retry(url)
+    resp = _fetch_with_retry(url, session=_SESSION)
 
     papers = []
     pattern = re.compile(
@@ -62,7 +67,7 @@ def _fetch_metadata_json(year: str, hash_id: str) -> Optional[dict]:
     """Fetch Metadata.json for a paper (available 1987-2019)."""
     url = f"{BASE_URL}/paper_files/paper/{year}/file/{hash_id}-Metadata.json"
     try:
-        resp = _fetch_with_retry(url)
+        resp = _fetch_with_retry(url, session=_SESSION)
         return resp.json()
     except (FileNotFoundError, RuntimeError):
         return None
@@ -73,12 +78,12 @@ def _fetch_paper_detail(year: str, hash_id: str, track: str) -> Optional[dict]:
     suffix = "Conference" if track == "conference" else "Datasets_and_Benchmarks_Track"
     url = f"{BASE_URL}/paper_files/paper/{year}/hash/{hash_id}-Abstract-{suffix}.html"
     try:
-        resp = _fetch_with_retry(url)
+        resp = _fetch_with_retry(url, session=_SESSION)
     except (FileNotFoundError, RuntimeError):
         # Try without track suffix
         url = f"{BASE_URL}/paper_files/paper/{year}/hash/{hash_id}-Abstract.html"
         try:
-            resp = _fetch_with_retry(url)
+            resp = _fetch_with_retry(url, session=_SESSION)
         except (FileNotFoundError, RuntimeError):
             return None
 
@@ -208,10 +213,12 @@ def process_year(year: str) -> list[dict]:
     results = fetch_parallel(
         list(entry_by_hash.keys()),
         lambda h: fetch_and_parse_paper(entry_by_hash[h], year, use_metadata_json),
-        max_workers=20, default=None, progress_interval=100,
+        max_workers=PAPER_WORKERS, default=None, progress_interval=100,
     )
 
-    papers = [p for p in results.values() if p is not None]
+    # keep index-page order: results arrive in completion order, which
+    # would make collision suffixes and the output order vary run to run
+    papers = [results[h] for h in entry_by_hash if results[h] is not None]
     bibtex_keys = [p["bibtex_key"] for p in papers]
 
     resolved_keys = resolve_bibtex_collisions(bibtex_keys)
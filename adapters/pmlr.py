@@ -14,7 +14,7 @@ from typing import Optional, Union
 import yaml
 
 from .common import make_bibtex_key, resolve_bibtex_collisions, normalize_paper, write_venue_json
-from .http import fetch_with_retry as _fetch_with_retry, fetch_parallel
+from .http import fetch_with_retry as _fetch_with_retry, fetch_parallel, make_session
 from .cache import should_fetch, mark_fetched
 
 logger = logging.getLogger(__name__)
@@ -22,6 +22,11 @@ logger = logging.getLogger(__name__)
 GITHUB_API = "https://api.github.com"
 GITHUB_RAW = "https://raw.githubusercontent.com/mlresearch"
 
+# Post files are fetched concurrently from raw.githubusercontent.com; size
+# the keep-alive pool to the worker count
+POST_WORKERS = 20
+_SESSION = make_session(pool_maxsize=POST_WORKERS)
+
 
 # Known PMLR volumes for major venues.
 # Format: (volume_number, venue_shortname, year)
@@ -160,7 +165,7 @@ def parse_pmlr_post(content: str) -> Optional[dict]:
 def fetch_volume_config(volume: Union[int, str]) -> dict:
     """Fetch _config.yml for a PMLR volume."""
     url = f"{GITHUB_RAW}/{_volume_repo(volume)}/gh-pages/_config.yml"
-    resp = _fetch_with_retry(url)
+    resp = _fetch_with_retry(url, session=_SESSION)
     return yaml.safe_load(resp.text)
 
 
@@ -173,18 +178,18 @@ def list_posts(volume: Union[int, str]) -> list[str]:
     repo = _volume_repo(volume)
 
     repo_url = f"{GITHUB_API}/repos/mlresearch/{repo}"
-    repo_resp = _fetch_with_retry(repo_url)
+    repo_resp = _fetch_with_retry(repo_url, session=_SESSION)
     repo_data = repo_resp.json()
     default_branch = repo_data.get("default_branch", "gh-pages")
 
     branch_url = f"{GITHUB_API}/repos/mlresearch/{repo}/git/refs/heads/{default_branch}"
-    branch_resp = _fetch_with_retry(branch_url)
+    branch_resp = _fetch_with_retry(branch_url, session=_SESSION)
     branch_data = branch_resp.json()
     sha = branch_data["object"]["sha"]
 
     # recursive tree avoids the 1000-item Contents API limit
     tree_url = f"{GITHUB_API}/repos/mlresearch/{repo}/git/trees/{sha}?recursive=1"
-    tree_resp = _fetch_with_retry(tree_url)
+    tree_resp = _fetch_with_retry(tree_url, session=_SESSION)
     tree_data = tree_resp.json()
 
     posts = []
@@ -199,7 +204,7 @@ def list_posts(volume: Union[int, str]) -> list[str]:
 def fetch_post(volume: Union[int, str], filename: str) -> str:
     """Fetch raw content of a single post file."""
     url = f"{GITHUB_RAW}/{_volume_repo(volume)}/gh-pages/_posts/{filename}"
-    resp = _fetch_with_retry(url)
+    resp = _fetch_with_retry(url, session=_SESSION)
     return resp.text
 
 
@@ -276,10 +281,12 @@ def process_volume(volume: Union[int, str], venue: str, year: str) -> list[dict]
     logger.info(f"  Fetching {len(post_files)} papers concurrently...")
     _fetch = partial(fetch_and_parse_post, volume, venue=venue, year=year, venue_name=venue_name)
     results = fetch_parallel(
-        post_files, _fetch, max_workers=20, default=None, progress_interval=100,
+        post_files, _fetch, max_workers=POST_WORKERS, default=None, progress_interval=100,
     )
 
-    papers = [p for p in results.values() if p is not None]
+    # keep listing order: results arrive in completion order, which would
+    # make collision suffixes and the output order vary run to run
+    papers = [results[f] for f in post_files if results[f] is not None]
     bibtex_keys = [p["bibtex_key"] for p in papers]
 
     resolved_keys = resolve_bibtex_collisions(bibtex_keys)
@@ -50,7 +50,7 @@ from adapters.dblp import (
     _discover_venue_stems,
     process_venue_year,
 )
-from adapters.common import normalize_paper, resolve_bibtex_collisions
+from adapters.common import normalize_papers, resolve_bibtex_collisions
 from adapters.semantic_scholar import enrich_papers
 
 logger = logging.getLogger(__name__)
@@ -154,7 +154,7 @@ def build_venue_legacy(
 
     # Phase 4: Normalize, resolve key collisions, and write compressed output
     output_dir.mkdir(parents=True, exist_ok=True)
-    records = [normalize_paper(p) for p in all_papers]
+    records = normalize_papers(all_papers)
 
     # Resolve bibtex key collisions (same author, year, venue, content word)
     old_keys = [r["bibtex_key"] for r in records]
@@ -36,7 +36,7 @@ from adapters.jmlr import fetch_all as jmlr_fetch_all, KNOWN_VOLUMES as JMLR_VOL
 from adapters.cvf import fetch_all as cvf_fetch_all, KNOWN_CONFERENCES as CVF_CONFERENCES
 from adapters.ecva import fetch_all as ecva_fetch_all, KNOWN_YEARS as ECVA_YEARS
 from adapters.dblp import fetch_all as dblp_fetch_all, DBLP_VENUES
-from adapters.cache import load_cache, save_cache
+from adapters.cache import load_cache, refresh_current_year, save_cache
 from scripts.build_content import build_all
 
 
@@ -76,6 +76,7 @@ def main():
 
 def _fetch(args, output_dir: Path) -> None:
     """Run all configured adapters."""
+    refresh_current_year()
     cache = None if args.force else load_cache(ROOT)
 
     if args.source in ("pmlr", "all"):
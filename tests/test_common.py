@@ -0,0 +1,78 @@
+"""Tests for adapters.common."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from adapters.common import load_known_abstracts, parse_bibtex_authors, write_venue_json
+
+
+class ParseBibtexAuthorsTest(unittest.TestCase):
+    def test_first_last_format(self):
+        self.assertEqual(
+            parse_bibtex_authors("Alice Smith and Bob Jones"),
+            [{"given": "Alice", "family": "Smith"}, {"given": "Bob", "family": "Jones"}],
+        )
+
+    def test_line_break_around_and(self):
+        self.assertEqual(
+            parse_bibtex_authors("Smith, Alice\n  and Jones, Bob"),
+            [{"given": "Alice", "family": "Smith"}, {"given": "Bob", "family": "Jones"}],
+        )
+
+    def test_trailing_and(self):
+        expected = [{"given": "A.", "family": "Smith"}, {"given": "B.", "family": "Jones"}]
+        self.assertEqual(parse_bibtex_authors("A. Smith and B. Jones and "), expected)
+        self.assertEqual(parse_bibtex_authors("Smith, A. and Jones, B.\nand "), expected)
+
+    def test_leading_and(self):
+        self.assertEqual(
+            parse_bibtex_authors(" and Smith, A. and Jones, B."),
+            [{"given": "A.", "family": "Smith"}, {"given": "B.", "family": "Jones"}],
+        )
+
+    def test_other_whitespace_around_and(self):
+        expected = [{"given": "A.", "family": "Smith"}, {"given": "B.", "family": "Jones"}]
+        for field in (
+            "Smith, A.  and Jones, B.",
+            "Smith, A.\tand Jones, B.",
+            "Smith, A.\u00a0and\u00a0Jones, B.",
+        ):
+            with self.subTest(field=field):
+                self.assertEqual(parse_bibtex_authors(field), expected)
+
+    def test_only_lowercase_and_separates(self):
+        self.assertEqual(len(parse_bibtex_authors("Smith, A. AND Jones, B.")), 1)
+        self.assertEqual(len(parse_bibtex_authors("Alice Sand and Bob Andy")), 2)
+
+
+class LoadKnownAbstractsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_maps_key_to_abstract(self):
+        papers = [
+            {"source_id": "a", "abstract": "Alpha."},
+            {"source_id": "b", "abstract": ""},
+            {"source_id": "", "abstract": "Orphan."},
+        ]
+        path = write_venue_json("cvpr", "2024", papers, self.dir)
+        self.assertEqual(load_known_abstracts(path, "source_id"), {"a": "Alpha."})
+
+    def test_missing_file(self):
+        self.assertEqual(load_known_abstracts(self.dir / "none.json.gz", "source_id"), {})
+
+    def test_truncated_file(self):
+        papers = [{"source_id": str(i), "abstract": "x" * 100} for i in range(100)]
+        path = write_venue_json("cvpr", "2024", papers, self.dir)
+        path.write_bytes(path.read_bytes()[:200])
+        with self.assertLogs("adapters.common", level="WARNING"):
+            self.assertEqual(load_known_abstracts(path, "source_id"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
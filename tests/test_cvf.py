@@ -0,0 +1,46 @@
+"""Tests for adapters.cvf listing-page parsing."""
+
+import unittest
+from unittest import mock
+
+from adapters import cvf
+
+_LISTING = """
+<dl>
+<dt class="ptitle"><br><a href="/content/CVPR2024/html/Doe_Deep_Nets_CVPR_2024_paper.html">Deep Nets</a></dt>
+<dd>
+<form id="form-Doe" action="/CVPR2024" method="post" class="authsearch">
+<a href="#" onclick="document.getElementById('form-Doe').submit();">Jane Doe</a>,
+</form>
+</dd>
+<dd>
+[<a href="/content/CVPR2024/papers/Doe_Deep_Nets_CVPR_2024_paper.pdf">pdf</a>]
+[<a href="/content/CVPR2024/supplemental/Doe_Deep_Nets_CVPR_2024_supplemental.pdf">supp</a>]
+[<a href="http://arxiv.org/abs/2401.00001"><span class="arxiv">arXiv</span></a>]
+<div class="link2">[<a class="fakelink">bibtex</a>]
+<div class="bibref pre-white-space">pages = {100-110}</div></div>
+</dd>
+</dl>
+"""
+
+
+class ListPapersTest(unittest.TestCase):
+    def _list(self, html):
+        resp = mock.Mock(text=html)
+        with mock.patch.object(cvf, "_fetch_with_retry", return_value=resp):
+            return cvf._list_papers("CVPR", "2024")
+
+    def test_links_and_nested_arxiv_anchor(self):
+        (paper,) = self._list(_LISTING)
+        self.assertEqual(paper["title"], "Deep Nets")
+        self.assertEqual(
+            paper["pdf_url"],
+            f"{cvf.BASE_URL}/content/CVPR2024/papers/Doe_Deep_Nets_CVPR_2024_paper.pdf",
+        )
+        self.assertTrue(paper["supp_url"].endswith("_supplemental.pdf"))
+        self.assertEqual(paper["arxiv_url"], "http://arxiv.org/abs/2401.00001")
+        self.assertEqual(paper["pages"], "100-110")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""Tests for adapters.http."""
+
+import unittest
+from unittest import mock
+
+from adapters import http
+
+
+def _response(status, headers=None):
+    return mock.Mock(status_code=status, headers=headers or {}, encoding="utf-8")
+
+
+class FetchWithRetryTest(unittest.TestCase):
+    def _fetch(self, *responses):
+        session = mock.Mock()
+        session.get.side_effect = list(responses)
+        limiter = mock.Mock()
+        with mock.patch.object(http.time, "sleep") as sleep:
+            resp = http.fetch_with_retry(
+                "https://example.org/x", session=session, rate_limiter=limiter,
+            )
+        return resp, sleep, limiter
+
+    def test_honours_retry_after(self):
+        ok = _response(200)
+        resp, sleep, limiter = self._fetch(_response(429, {"Retry-After": "7"}), ok)
+        self.assertIs(resp, ok)
+        sleep.assert_called_once_with(7)
+        limiter.pause.assert_called_once_with(7)
+
+    def test_retry_after_above_cap_uses_backoff(self):
+        ok = _response(200)
+        resp, sleep, limiter = self._fetch(_response(429, {"Retry-After": "86400"}), ok)
+        self.assertIs(resp, ok)
+        sleep.assert_called_once_with(2)
+        limiter.pause.assert_called_once_with(2)
+
+
+if __name__ == "__main__":
+    unittest.main()